@@ -0,0 +1,267 @@
+"""
+Benchmarks for spectra.
+
+Usage:
+
+    python benchmarks/bench.py                          # run everything
+    python benchmarks/bench.py -k scale                 # only names containing "scale"
+    python benchmarks/bench.py --save results.json      # save results
+    python benchmarks/bench.py --compare benchmarks/baseline.json
+
+Each benchmark reports the best per-call time over several repeats.
+Comparisons flag benchmarks that got slower than `--threshold` times
+their saved time; with `--fail`, any such regression exits with status 1.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import numpy as np
+import spectra
+from spectra.grapefruit import Color as GC
+
+BULK_SIZE = 100000
+GRAPEFRUIT_BULK_SIZE = 1000
+
+SAMPLES = {
+    "lab": (50.0, -20.0, 30.0),
+    "rgb": (0.2, 0.5, 0.7),
+    "lch": (60.0, 40.0, 300.0),
+    "xyz": (0.2, 0.3, 0.4),
+    "hsl": (200.0, 0.5, 0.4),
+    "hsv": (200.0, 0.5, 0.4),
+    "cmy": (0.1, 0.5, 0.9),
+    "cmyk": (0.1, 0.5, 0.9, 0.2),
+}
+
+GRAPEFRUIT_ARGS = {
+    "RgbToHsl": (0.2, 0.5, 0.7),
+    "HslToRgb": (200.0, 0.5, 0.4),
+    "RgbToHsv": (0.2, 0.5, 0.7),
+    "HsvToRgb": (200.0, 0.5, 0.4),
+    "RgbToYiq": (0.2, 0.5, 0.7),
+    "YiqToRgb": (0.4, -0.1, 0.05),
+    "RgbToYuv": (0.2, 0.5, 0.7),
+    "YuvToRgb": (0.4, 0.1, -0.1),
+    "RgbToXyz": (0.2, 0.5, 0.7),
+    "XyzToRgb": (0.2, 0.3, 0.4),
+    "XyzToLab": (0.2, 0.3, 0.4),
+    "LabToXyz": (50.0, -20.0, 30.0),
+    "CmykToCmy": (0.1, 0.5, 0.9, 0.2),
+    "CmyToCmyk": (0.1, 0.5, 0.9),
+    "RgbToCmy": (0.2, 0.5, 0.7),
+    "CmyToRgb": (0.1, 0.5, 0.9),
+    "RgbToIntTuple": (0.2, 0.5, 0.7),
+    "IntTupleToRgb": ((51, 128, 179),),
+    "RgbToHtml": (0.2, 0.5, 0.7),
+    "HtmlToRgb": ("#3380b3",),
+    "RgbToPil": (0.2, 0.5, 0.7),
+    "PilToRgb": (11763763,),
+    "RgbToWebSafe": (0.2, 0.5, 0.7),
+    "RgbToGreyscale": (0.2, 0.5, 0.7),
+    "RgbToRyb": (200.0,),
+    "RybToRgb": (200.0,),
+}
+
+BENCHMARKS = {}
+
+def benchmark(name):
+    def decorator(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return decorator
+
+def _register_color_benchmarks():
+    for space, values in sorted(SAMPLES.items()):
+        def init(space=space, values=values):
+            return lambda: spectra.Color(space, *values)
+        BENCHMARKS["color_init[{0}]".format(space)] = init
+
+        def to_rgb(space=space, values=values):
+            return lambda: spectra.Color(space, *values).to("rgb")
+        BENCHMARKS["color_to[{0}->rgb]".format(space)] = to_rgb
+
+        def from_rgb(space=space):
+            c = spectra.Color("rgb", *SAMPLES["rgb"])
+            return lambda: c.to(space).values
+        BENCHMARKS["color_to[rgb->{0}]".format(space)] = from_rgb
+
+        def bulk_to_rgb(space=space, values=values):
+            arr = spectra.ColorArray(space, np.tile(values, (BULK_SIZE, 1)))
+            return lambda: arr.to("rgb")
+        BENCHMARKS["bulk_to[{0}->rgb]".format(space)] = bulk_to_rgb
+
+        def bulk_from_rgb(space=space):
+            arr = spectra.ColorArray("rgb", np.tile(SAMPLES["rgb"], (BULK_SIZE, 1)))
+            return lambda: arr.to(space)
+        BENCHMARKS["bulk_to[rgb->{0}]".format(space)] = bulk_from_rgb
+
+def _register_grapefruit_benchmarks():
+    for name, args in sorted(GRAPEFRUIT_ARGS.items()):
+        def single(name=name, args=args):
+            f = getattr(GC, name)
+            return lambda: f(*args)
+        BENCHMARKS["grapefruit[{0}]".format(name)] = single
+
+        def bulk(name=name, args=args):
+            f = getattr(GC, name)
+            batch = [ args ] * GRAPEFRUIT_BULK_SIZE
+            return lambda: [ f(*a) for a in batch ]
+        BENCHMARKS["grapefruit_bulk[{0}]".format(name)] = bulk
+
+_register_color_benchmarks()
+_register_grapefruit_benchmarks()
+
+@benchmark("import_spectra")
+def _():
+    # A fresh interpreter each time, so nothing is already imported.
+    argv = [ sys.executable, "-c", "import spectra" ]
+    return lambda: subprocess.check_call(argv, cwd=os.path.dirname(HERE))
+
+@benchmark("color_hexcode")
+def _():
+    return lambda: spectra.lab(50, 20, 30).hexcode
+
+@benchmark("color_brighten")
+def _():
+    c = spectra.html("teal")
+    return lambda: c.brighten(10)
+
+@benchmark("bulk_brighten[100000]")
+def _():
+    arr = spectra.ColorArray("rgb", np.tile(SAMPLES["rgb"], (BULK_SIZE, 1)))
+    amounts = np.linspace(-10, 10, BULK_SIZE)
+    return lambda: arr.brighten(amounts)
+
+@benchmark("triadic[10000]")
+def _():
+    arr = spectra.ColorArray("hsl", np.column_stack((np.linspace(0, 359, 10000),
+        np.full(10000, 0.6), np.full(10000, 0.5))))
+    return lambda: spectra.triadic(arr)
+
+@benchmark("dither[floyd-steinberg,256x256]")
+def _():
+    image = np.random.RandomState(0).uniform(0, 1, (256, 256, 3))
+    return lambda: spectra.dither(image, "websafe", "floyd-steinberg")
+
+@benchmark("composite[over,8x512x512]")
+def _():
+    layers = np.random.RandomState(0).uniform(0, 1, (8, 512, 512, 4))
+    return lambda: spectra.composite(layers)
+
+@benchmark("from_html[hex]")
+def _():
+    return lambda: spectra.html("#3380b3")
+
+@benchmark("from_html[named]")
+def _():
+    return lambda: spectra.html("papayawhip")
+
+@benchmark("html_many[10000]")
+def _():
+    strings = [ "#%06x" % (i * 997) for i in range(10000) ]
+    return lambda: spectra.html_many(strings)
+
+@benchmark("scale_call")
+def _():
+    s = spectra.scale([ "yellow", "red", "black" ]).domain([ 0, 50, 100 ])
+    return lambda: s(37.5)
+
+@benchmark("scale_call_hexcode")
+def _():
+    s = spectra.scale([ "yellow", "red", "black" ]).domain([ 0, 50, 100 ])
+    return lambda: s(37.5).hexcode
+
+@benchmark("scale_range[100]")
+def _():
+    s = spectra.scale([ "yellow", "red", "black" ])
+    return lambda: s.range(100)
+
+@benchmark("scale_map[100000]")
+def _():
+    s = spectra.scale([ "yellow", "red", "black" ]).colorspace("lab")
+    numbers = np.linspace(0, 1, BULK_SIZE)
+    return lambda: s.map(numbers)
+
+@benchmark("compiled_scale_hexcode")
+def _():
+    s = spectra.scale([ "yellow", "red", "black" ]).compile(resolution=1024)
+    return lambda: s.hexcode(0.375)
+
+def measure(setup, repeat):
+    """
+    Return the best per-call time of the benchmark, in seconds.
+    """
+    timer = timeit.Timer(setup())
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def metadata():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "numpy": np.__version__,
+        "spectra": spectra.__version__,
+        "engine": spectra.get_engine(),
+    }
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return "{0:.2f} {1}".format(seconds * scale, unit)
+    return "{0:.0f} ns".format(seconds * 1e9)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run spectra's benchmarks.")
+    parser.add_argument("-k", dest="keyword", default="",
+        help="Only run benchmarks whose names contain this string.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="Write results to this JSON file.")
+    parser.add_argument("--compare", help="Compare against this JSON file.")
+    parser.add_argument("--threshold", type=float, default=1.25,
+        help="Slowdown ratio that counts as a regression.")
+    parser.add_argument("--fail", action="store_true",
+        help="Exit with status 1 if any benchmark regressed.")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+
+    results = {}
+    regressions = []
+    for name in sorted(BENCHMARKS):
+        if args.keyword not in name: continue
+        seconds = measure(BENCHMARKS[name], args.repeat)
+        results[name] = seconds
+        line = "{0:<40} {1:>12}".format(name, format_time(seconds))
+        if name in baseline:
+            ratio = seconds / baseline[name]
+            line += "  {0:>6.2f}x".format(ratio)
+            if ratio > args.threshold:
+                line += "  REGRESSION"
+                regressions.append(name)
+        print(line)
+        sys.stdout.flush()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({ "meta": metadata(), "results": results }, f,
+                indent=2, sort_keys=True)
+            f.write("\n")
+
+    if regressions and args.fail:
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,6 +38,9 @@ setup(
     include_package_data=False,
     zip_safe=False,
     install_requires=reqs,
+    entry_points={
+        "console_scripts": [ "spectra = spectra.cli:main" ],
+    },
     tests_require=[],
     test_suite="test"
 )
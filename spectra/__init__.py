@@ -1,20 +1,61 @@
-from .core import COLOR_SPACES, Color, Scale
+from .core import COLOR_SPACES, Color, Scale, CompiledScale
+from .core import enable_cache, disable_cache, cache_info, cache_clear
+from .engine import set_engine, get_engine
 from ._version import __version__
 
-def lab(L, a, b):
+# These (and NumPy) are only imported on first use.
+_LAZY_ATTRIBUTES = {
+    "ColorArray": "array",
+    "as_color_array": "array",
+    "delta_e": "difference",
+    "delta_e_matrix": "difference",
+    "nearest_names": "names",
+    "convert_file": "files",
+    "map_file": "files",
+    "in_gamut": "gamut",
+    "gamut_map": "gamut",
+    "complementary": "harmony",
+    "triadic": "harmony",
+    "tetradic": "harmony",
+    "analogous": "harmony",
+    "monochrome": "harmony",
+    "dither": "dithering",
+    "composite": "compositing",
+    "ops": "pipeline",
+    "Pipeline": "pipeline",
+}
+
+def __getattr__(name):
+    import importlib
+    import importlib.util
+    if name not in _LAZY_ATTRIBUTES:
+        # Submodules, e.g. spectra.parallel, are imported on first use, too.
+        if not name.startswith("_") and importlib.util.find_spec("." + name, __name__):
+            return importlib.import_module("." + name, __name__)
+        raise AttributeError("module 'spectra' has no attribute '{0}'".format(name))
+    module = importlib.import_module("." + _LAZY_ATTRIBUTES[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+def lab(L, a, b, alpha=1.0):
     """
     Create a spectra.Color object in the CIELAB color space.
 
     :param float L: L coordinate.
     :param float a: a coordinate.
     :param float b: b coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the CIELAB color space.
     """
-    return Color("lab", L, a, b)
+    return Color("lab", L, a, b, alpha=alpha)
 
-def lch(L, c, h):
+def lch(L, c, h, alpha=1.0):
     """
     Create a spectra.Color object in the CIE LCH color space.
 
@@ -23,13 +64,14 @@ def lch(L, c, h):
     :param float L: L coordinate.
     :param float c: c coordinate.
     :param float h: h coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the CIE LCH color space.
     """
-    return Color("lch", L, c, h)
+    return Color("lch", L, c, h, alpha=alpha)
 
-def xyz(x, y, z):
+def xyz(x, y, z, alpha=1.0):
     """
     Create a spectra.Color object in the XYZ color space.
 
@@ -38,13 +80,14 @@ def xyz(x, y, z):
     :param float x: x coordinate.
     :param float y: y coordinate.
     :param float z: z coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the XYZ color space.
     """
-    return Color("xyz", x, y, z)
+    return Color("xyz", x, y, z, alpha=alpha)
 
-def rgb(r, g, b):
+def rgb(r, g, b, alpha=1.0):
     """
     Create a spectra.Color object in the sRGB color space.
 
@@ -54,13 +97,14 @@ def rgb(r, g, b):
     :param float r: r coordinate.
     :param float g: g coordinate.
     :param float b: b coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the sRGB color space.
     """
-    return Color("rgb", r, g, b)
+    return Color("rgb", r, g, b, alpha=alpha)
 
-def cmyk(c, m, y, k):
+def cmyk(c, m, y, k, alpha=1.0):
     """
     Create a spectra.Color object in the CMYK color space.
 
@@ -68,56 +112,60 @@ def cmyk(c, m, y, k):
     :param float m: m coordinate.
     :param float y: y coordinate.
     :param float k: k coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the CMYK color space.
     """
-    return Color("cmyk", c, m, y, k)
+    return Color("cmyk", c, m, y, k, alpha=alpha)
 
-def cmy(c, m, y):
+def cmy(c, m, y, alpha=1.0):
     """
     Create a spectra.Color object in the CMY color space.
 
     :param float c: c coordinate.
     :param float m: m coordinate.
     :param float y: y coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the CMY color space.
     """
-    return Color("cmyk", c, m, y)
+    return Color("cmy", c, m, y, alpha=alpha)
 
-def hsl(h, s, l):
+def hsl(h, s, l, alpha=1.0):
     """
     Create a spectra.Color object in the HSL color space.
 
     :param float h: h coordinate.
     :param float s: s coordinate.
     :param float l: l coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the HSL color space.
     """
-    return Color("hsl", h, s, l)
+    return Color("hsl", h, s, l, alpha=alpha)
 
-def hsv(h, s, v):
+def hsv(h, s, v, alpha=1.0):
     """
     Create a spectra.Color object in the HSV color space.
 
     :param float h: h coordinate.
     :param float s: s coordinate.
     :param float v: v coordinate.
+    :param float alpha: Opacity, from 0.0 to 1.0.
 
     :rtype: Color
     :returns: A spectra.Color object in the HSV color space.
     """
-    return Color("hsv", h, s, v)
+    return Color("hsv", h, s, v, alpha=alpha)
 
 def html(html_string):
     """
     Create an RGB spectra.Color object from a web-color or hexcode.
 
-    E.g.: "papayawhip", "#FFF", "#ffffff", "FFEFD5"
+    E.g.: "papayawhip", "#FFF", "#ffffff", "FFEFD5", "#ffffff80"
 
     :param str html_string: Web-color or hexcode.
 
@@ -126,6 +174,101 @@ def html(html_string):
     """
     return Color.from_html(html_string)
 
+def html_many(html_strings):
+    """
+    Create an RGB spectra.ColorArray from many web-colors or hexcodes.
+
+    :param list html_strings: Web-color names or hexcodes.
+
+    :rtype: ColorArray
+    :returns: A spectra.ColorArray in the sRGB color space.
+    """
+    from .array import ColorArray
+    from .core import _parse_html_rgba
+    rgba = [ _parse_html_rgba(h) for h in html_strings ]
+    alpha = None
+    if any(c[3] != 1.0 for c in rgba):
+        alpha = [ c[3] for c in rgba ]
+    return ColorArray("rgb", [ c[:3] for c in rgba ], alpha)
+
+def to_hex(colors):
+    """
+    Get the RGB hexcodes for many colors in one pass.
+
+    Colors are grouped by color space and converted in bulk.
+
+    :param colors: A spectra.ColorArray, or a list of spectra.Color objects.
+
+    :rtype: list
+    :returns: A list of six-character strings.
+    """
+    from .array import as_color_array
+    return as_color_array(colors, "rgb").hexcodes
+
+def brighten(colors, amounts=10):
+    """
+    Brighten many colors at once, by `amounts` luminance.
+
+    :param colors: A spectra.ColorArray, or a list of spectra.Color objects.
+    :param amounts: Amount to increase the luminance, either a single
+        number or one number per color.
+    :type amounts: float or array-like
+
+    :rtype: ColorArray
+    :returns: A spectra.ColorArray, in the color space of `colors` (or,
+        for lists, of the first color).
+    """
+    from .array import as_color_array
+    return as_color_array(colors).brighten(amounts)
+
+def darken(colors, amounts=10):
+    """
+    Darken many colors at once, by `amounts` luminance.
+
+    :param colors: A spectra.ColorArray, or a list of spectra.Color objects.
+    :param amounts: Amount to decrease the luminance, either a single
+        number or one number per color.
+    :type amounts: float or array-like
+
+    :rtype: ColorArray
+    :returns: A spectra.ColorArray, in the color space of `colors` (or,
+        for lists, of the first color).
+    """
+    from .array import as_color_array
+    return as_color_array(colors).darken(amounts)
+
+def saturate(colors, amounts=10):
+    """
+    Saturate many colors at once, by `amounts` chroma.
+
+    :param colors: A spectra.ColorArray, or a list of spectra.Color objects.
+    :param amounts: Amount to increase the chroma, either a single
+        number or one number per color.
+    :type amounts: float or array-like
+
+    :rtype: ColorArray
+    :returns: A spectra.ColorArray, in the color space of `colors` (or,
+        for lists, of the first color).
+    """
+    from .array import as_color_array
+    return as_color_array(colors).saturate(amounts)
+
+def desaturate(colors, amounts=10):
+    """
+    Desaturate many colors at once, by `amounts` chroma.
+
+    :param colors: A spectra.ColorArray, or a list of spectra.Color objects.
+    :param amounts: Amount to decrease the chroma, either a single
+        number or one number per color.
+    :type amounts: float or array-like
+
+    :rtype: ColorArray
+    :returns: A spectra.ColorArray, in the color space of `colors` (or,
+        for lists, of the first color).
+    """
+    from .array import as_color_array
+    return as_color_array(colors).desaturate(amounts)
+
 def scale(colors):
     """
     Create a color scale, based on a list of spectra.Color objects.
@@ -157,3 +300,20 @@ def range(colors, count):
     :returns: A list of `count` spectra.Color objects.
     """
     return Scale(colors).range(count)
+
+def iter_range(colors, count, chunk=None):
+    """
+    Lazily generate `count` colors between two or more base colors.
+
+    Colors should be a list of spectra.Color objects, web-color strings,
+    or hexcode strings.
+
+    :param list colors: spectra.Color objects or web-color/hexcode strings.
+    :param int count: the number of colors to generate.
+    :param chunk: If given, yield spectra.ColorArray objects of this many colors.
+    :type chunk: int or None
+
+    :rtype: iterator
+    :returns: An iterator of spectra.Color or spectra.ColorArray objects.
+    """
+    return Scale(colors).iter_range(count, chunk)
@@ -0,0 +1,4 @@
+import sys
+from spectra.cli import main
+
+sys.exit(main())
@@ -0,0 +1,242 @@
+import numbers
+import numpy as np
+from spectra import conversions
+from spectra.core import Color
+
+class ColorArray(object):
+    """
+    Represents many colors in a single color space, backed by a NumPy array.
+    """
+    def __init__(self, space, values, alpha=None):
+        """
+        :param str space: Name of the color space.
+        :param values: Array-like of shape (N, k), one row per color.
+        :param alpha: Array-like of N opacities, from 0.0 to 1.0. None
+            means every color is opaque.
+        """
+        if space not in conversions.DIMENSIONS:
+            raise ValueError("Unknown color space: '{0}'".format(space))
+        k = conversions.DIMENSIONS[space]
+        values = np.array(values, dtype=float)
+        if values.size == 0:
+            values = values.reshape(0, k)
+        elif values.ndim == 1 and len(values) == k:
+            values = values.reshape(1, k)
+        if values.ndim != 2 or values.shape[1] != k:
+            msg = "Color space '{0}' expects an (N, {1}) array of values."
+            raise ValueError(msg.format(space, k))
+        if alpha is not None:
+            alpha = np.array(alpha, dtype=float).reshape(-1)
+            if len(alpha) != len(values):
+                raise ValueError("Expected one alpha per color.")
+            if np.any((alpha < 0.0) | (alpha > 1.0)):
+                raise ValueError("Alpha must be between 0.0 and 1.0.")
+        self.space = space
+        self.values = values
+        self.alpha = alpha
+
+    @classmethod
+    def from_colors(cls, colors, space=None):
+        """
+        Create a ColorArray from a list of spectra.Color objects.
+
+        Colors that share a color space are converted in bulk.
+
+        :param list colors: spectra.Color objects.
+        :param str space: Color space of the new array. Defaults to the
+            color space of the first color.
+
+        :rtype: ColorArray
+        :returns: A new spectra.ColorArray
+        """
+        colors = list(colors)
+        if space is None:
+            if not len(colors):
+                raise ValueError("Cannot infer a color space from no colors.")
+            space = colors[0].space
+        values = np.empty((len(colors), conversions.DIMENSIONS[space]))
+        by_space = {}
+        for i, c in enumerate(colors):
+            by_space.setdefault(c.space, []).append(i)
+        for source, indices in by_space.items():
+            if source in conversions.DIMENSIONS:
+                source_values = [ colors[i].values for i in indices ]
+                values[indices] = conversions.convert(source_values, source, space)
+            else:
+                values[indices] = [ colors[i].to(space).values for i in indices ]
+        alpha = None
+        if any(c.alpha != 1.0 for c in colors):
+            alpha = [ c.alpha for c in colors ]
+        return cls(space, values, alpha)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, key):
+        if isinstance(key, (numbers.Integral, np.integer)):
+            alpha = 1.0 if self.alpha is None else float(self.alpha[key])
+            return Color(self.space, *self.values[key].tolist(), alpha=alpha)
+        # Slices, index lists, and boolean masks select a new ColorArray.
+        alpha = None if self.alpha is None else self.alpha[key]
+        return self.__class__(self.space, self.values[key], alpha)
+
+    def __iter__(self):
+        if self.alpha is None:
+            for row in self.values.tolist():
+                yield Color(self.space, *row)
+            return
+        for row, alpha in zip(self.values.tolist(), self.alpha.tolist()):
+            yield Color(self.space, *row, alpha=alpha)
+
+    def to(self, space):
+        """
+        Convert all colors to a different color space.
+
+        :param str space: Name of the color space.
+
+        :rtype: ColorArray
+        :returns: A new spectra.ColorArray in the given color space.
+        """
+        if space == self.space: return self
+        values = conversions.convert(self.values, self.space, space)
+        return self.__class__(space, values, self.alpha)
+
+    def to_colors(self):
+        """
+        List these colors as spectra.Color objects.
+
+        :rtype: list
+        :returns: A list of spectra.Color objects.
+        """
+        return list(self)
+
+    @property
+    def rgb(self):
+        """
+        Get these colors' (r, g, b) values, allowed to go out of gamut.
+
+        :rtype: numpy.ndarray
+        :returns: An (N, 3) array.
+        """
+        return self.to("rgb").values
+
+    @property
+    def clamped_rgb(self):
+        """
+        Get these colors' (r, g, b) values, clamped to 0.0-1.0.
+
+        :rtype: numpy.ndarray
+        :returns: An (N, 3) array.
+        """
+        return conversions.clamp_rgb(self.rgb)
+
+    @property
+    def rgba(self):
+        """
+        Get these colors' clamped (r, g, b) values, plus their alphas.
+
+        :rtype: numpy.ndarray
+        :returns: An (N, 4) array.
+        """
+        alpha = np.ones(len(self)) if self.alpha is None else self.alpha
+        return np.column_stack((self.clamped_rgb, alpha))
+
+    @property
+    def hexcodes(self):
+        """
+        Get these colors' corresponding RGB hexes.
+
+        :rtype: list
+        :returns: A list of six-character strings.
+        """
+        return conversions.hexcodes(self.clamped_rgb)
+
+    def _adjust_lch(self, channel, amounts):
+        """
+        Add `amounts` to one LCH channel of every color, converting to LCH
+        and back once for the whole array.
+        """
+        amounts = np.asarray(amounts, dtype=float)
+        if amounts.ndim > 1 or (amounts.ndim == 1 and len(amounts) != len(self)):
+            raise ValueError("Expected one amount, or one amount per color.")
+        lch = np.array(conversions.convert(self.values, self.space, "lch"))
+        lch[:, channel] += amounts
+        return self.__class__("lch", lch, self.alpha).to(self.space)
+
+    def brighten(self, amount=10):
+        """
+        Brighten these colors by `amount` luminance.
+
+        Like Color.brighten, but for all colors at once.
+
+        :param amount: Amount to increase the luminance, either a single
+            number or one number per color.
+        :type amount: float or array-like
+
+        :rtype: ColorArray
+        :returns: A new spectra.ColorArray
+        """
+        return self._adjust_lch(0, amount)
+
+    def darken(self, amount=10):
+        """
+        Darken these colors by `amount` luminance.
+
+        Like Color.darken, but for all colors at once.
+
+        :param amount: Amount to decrease the luminance, either a single
+            number or one number per color.
+        :type amount: float or array-like
+
+        :rtype: ColorArray
+        :returns: A new spectra.ColorArray
+        """
+        return self._adjust_lch(0, -np.asarray(amount, dtype=float))
+
+    def saturate(self, amount=10):
+        """
+        Saturate these colors by `amount` chroma.
+
+        Like Color.saturate, but for all colors at once.
+
+        :param amount: Amount to increase the chroma, either a single
+            number or one number per color.
+        :type amount: float or array-like
+
+        :rtype: ColorArray
+        :returns: A new spectra.ColorArray
+        """
+        return self._adjust_lch(1, amount)
+
+    def desaturate(self, amount=10):
+        """
+        Desaturate these colors by `amount` chroma.
+
+        Like Color.desaturate, but for all colors at once.
+
+        :param amount: Amount to decrease the chroma, either a single
+            number or one number per color.
+        :type amount: float or array-like
+
+        :rtype: ColorArray
+        :returns: A new spectra.ColorArray
+        """
+        return self._adjust_lch(1, -np.asarray(amount, dtype=float))
+
+def as_color_array(colors, space=None):
+    """
+    Coerce colors to a spectra.ColorArray.
+
+    :param colors: A spectra.ColorArray, a spectra.Color, or a list of
+        spectra.Color objects.
+    :param str space: Color space of the result. Defaults to the colors'
+        own (or, for lists, the first color's) color space.
+
+    :rtype: ColorArray
+    :returns: A spectra.ColorArray
+    """
+    if isinstance(colors, ColorArray):
+        return colors if space is None else colors.to(space)
+    if isinstance(colors, Color):
+        colors = [ colors ]
+    return ColorArray.from_colors(colors, space)
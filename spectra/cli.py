@@ -0,0 +1,147 @@
+"""
+Command-line color mapping and conversion.
+
+Reads numbers (with --colors) or colors (with --to) from files or stdin,
+one per line, and writes one result per line. Input is processed in
+batches of --batch-size lines, so memory use is constant however long the
+input is.
+
+    $ seq 0 10 100 | python -m spectra --colors white,red --domain 0,100
+    $ echo "50 20 -30" | python -m spectra --from lab --to rgb
+"""
+import argparse
+import itertools
+import sys
+import numpy as np
+from spectra import conversions
+from spectra.spaces import DIMENSIONS
+
+DEFAULT_BATCH_SIZE = 1 << 16
+
+def _split(text):
+    return [ x.strip() for x in text.split(",") if x.strip() ]
+
+def _read_lines(paths, stdin):
+    for path in paths or [ "-" ]:
+        if path == "-":
+            lines = stdin
+        else:
+            lines = open(path)
+        try:
+            for line in lines:
+                line = line.strip()
+                if line: yield line
+        finally:
+            if lines is not stdin:
+                lines.close()
+
+def _batches(lines, size):
+    while True:
+        batch = list(itertools.islice(lines, size))
+        if not batch: return
+        yield batch
+
+def _parse_values(batch, dimensions):
+    values = np.array(" ".join(batch).replace(",", " ").split(), dtype=float)
+    if values.size != len(batch) * dimensions:
+        raise ValueError("Expected {0} values per line.".format(dimensions))
+    return values.reshape(-1, dimensions)
+
+def _format_values(values):
+    return [ ",".join("%.6g" % v for v in row) for row in values.tolist() ]
+
+def _format(rgb, values, output, invalid=None, mask_color=""):
+    if output == "values":
+        lines = _format_values(values)
+    elif output == "rgb":
+        lines = _format_values(rgb)
+    else:
+        lines = conversions.hexcodes(np.nan_to_num(rgb))
+    if invalid is not None:
+        for i in np.flatnonzero(invalid).tolist():
+            lines[i] = mask_color
+    return lines
+
+def _map_batch(scale, batch, args):
+    numbers = np.array(batch, dtype=float)
+    colors = scale.map(numbers, output="array", out_of_domain=args.out_of_domain)
+    invalid = np.isnan(colors.values).any(axis=1)
+    rgb = conversions.clamp_rgb(conversions.convert(colors.values, colors.space, "rgb"))
+    return _format(rgb, colors.values, args.output, invalid, args.mask_color)
+
+def _convert_batch(batch, args):
+    if args.from_space == "html":
+        from spectra.core import _parse_html
+        values = np.array([ _parse_html(h) for h in batch ], dtype=float)
+        from_space = "rgb"
+    else:
+        values = _parse_values(batch, DIMENSIONS[args.from_space])
+        from_space = args.from_space
+    converted = conversions.convert(values, from_space, args.to_space)
+    if args.output == "values":
+        rgb = None
+    else:
+        rgb = conversions.clamp_rgb(conversions.convert(values, from_space, "rgb"))
+    return _format(rgb, converted, args.output)
+
+def _parser():
+    spaces = sorted(DIMENSIONS)
+    parser = argparse.ArgumentParser(prog="spectra",
+        description="Map numbers through a color scale, or convert colors.")
+    parser.add_argument("files", nargs="*",
+        help="Files to read, one number or color per line. Defaults to stdin.")
+    parser.add_argument("--colors",
+        help="Comma-separated web-colors or hexcodes; maps numbers through a scale.")
+    parser.add_argument("--domain",
+        help="Comma-separated numbers, one per color. Defaults to 0-1.")
+    parser.add_argument("--space", choices=spaces,
+        help="Color space to interpolate the scale in.")
+    parser.add_argument("--out-of-domain", default="raise",
+        choices=("raise", "clip", "mask"))
+    parser.add_argument("--mask-color", default="",
+        help="Line to write for masked numbers.")
+    parser.add_argument("--from", dest="from_space", default="rgb",
+        choices=spaces + [ "html" ],
+        help="Color space of the input colors, or 'html' for web-colors/hexcodes.")
+    parser.add_argument("--to", dest="to_space", choices=spaces,
+        help="Color space to convert colors to.")
+    parser.add_argument("--output", choices=("hex", "rgb", "values"),
+        help="Hexcodes, clamped RGB values, or the scale's/target space's values. "
+            "Defaults to hex with --colors, and to values with --to.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+        help="Lines to process at a time.")
+    return parser
+
+def main(argv=None, stdin=None, stdout=None):
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    parser = _parser()
+    args = parser.parse_args(argv)
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.colors:
+        from spectra.core import Scale
+        try:
+            scale = Scale(_split(args.colors))
+            if args.domain:
+                scale = scale.domain([ float(x) for x in _split(args.domain) ])
+            if args.space:
+                scale = scale.colorspace(args.space)
+        except (KeyError, ValueError) as e:
+            parser.error("invalid scale: {0}".format(e))
+        args.output = args.output or "hex"
+        process = lambda batch: _map_batch(scale, batch, args)
+    elif args.to_space:
+        args.output = args.output or "values"
+        process = lambda batch: _convert_batch(batch, args)
+    else:
+        parser.error("one of --colors or --to is required")
+
+    try:
+        for batch in _batches(_read_lines(args.files, stdin), args.batch_size):
+            stdout.write("\n".join(process(batch)) + "\n")
+    except ValueError as e:
+        parser.exit(1, "{0}: error: {1}\n".format(parser.prog, e))
+    except BrokenPipeError:
+        sys.stderr.close()
+    return 0
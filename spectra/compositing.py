@@ -0,0 +1,96 @@
+"""
+Vectorized alpha compositing.
+
+Layers are stacked bottom-first and composited in one pass over whole
+arrays. For the "over" operator, the result has a closed form: with
+premultiplied colors c_i and alphas a_i,
+
+    c = sum(c_i * prod(1 - a_j for j > i))
+    a = 1 - prod(1 - a_i)
+
+so the per-layer products are a single reversed cumulative product,
+rather than one blend per layer. The separable blend modes ("multiply",
+"screen") follow the W3C Compositing and Blending spec, one vectorized
+step per layer.
+"""
+import numpy as np
+
+MODES = ("over", "multiply", "screen")
+
+_BLEND_FUNCTIONS = {
+    "multiply": lambda backdrop, source: backdrop * source,
+    "screen": lambda backdrop, source: backdrop + source - (backdrop * source),
+}
+
+def _stack(layers):
+    """
+    Get layers as an (L, ..., 4) float array, and whether they were Colors.
+    """
+    from spectra.core import Color
+    if isinstance(layers, (list, tuple)) and layers and \
+            all(isinstance(layer, Color) for layer in layers):
+        return np.array([ layer.rgba for layer in layers ], dtype=float), True
+    stack = np.asarray(layers, dtype=float)
+    if stack.ndim < 2 or stack.shape[-1] != 4:
+        raise ValueError("composite expects layers of RGBA values, shaped (L, ..., 4).")
+    return stack, False
+
+def _composite_over(colors, alphas):
+    transparency = 1.0 - alphas
+    above = np.cumprod(transparency[::-1], axis=0)[::-1]
+    # Each layer shows through the layers above it, not through itself.
+    weights = np.concatenate((above[1:], np.ones_like(above[:1])))
+    return np.sum(colors * weights[..., None], axis=0), 1.0 - above[0]
+
+def _composite_blend(colors, alphas, blend):
+    color, alpha = colors[0], alphas[0]
+    for source, source_alpha in zip(colors[1:], alphas[1:]):
+        a = source_alpha[..., None]
+        b = alpha[..., None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            straight_backdrop = np.where(b > 0, color / b, 0.0)
+            straight_source = np.where(a > 0, source / a, 0.0)
+        mixed = blend(straight_backdrop, straight_source)
+        color = (source * (1.0 - b)) + (color * (1.0 - a)) + (a * b * mixed)
+        alpha = source_alpha + (alpha * (1.0 - source_alpha))
+    return color, alpha
+
+def composite(layers, mode="over", premultiplied=False):
+    """
+    Composite stacked RGBA layers, bottom layer first.
+
+    :param layers: An (L, ..., 4) array-like of RGBA values between 0.0
+        and 1.0 (e.g. L images, each (height, width, 4)), or a list of
+        spectra.Color objects.
+    :param str mode: "over", "multiply", or "screen".
+    :param bool premultiplied: Whether the layers' RGB values are already
+        multiplied by their alpha. The result uses the same convention.
+
+    :rtype: numpy.ndarray or Color
+    :returns: An (..., 4) array of RGBA values; or, for a list of
+        spectra.Color objects, a spectra.Color in the sRGB color space.
+    """
+    if mode not in MODES:
+        raise ValueError("Unknown compositing mode: '{0}'".format(mode))
+    stack, single = _stack(layers)
+    if not len(stack):
+        raise ValueError("composite needs at least one layer.")
+    alphas = stack[..., 3]
+    colors = stack[..., :3]
+    if not premultiplied:
+        colors = colors * alphas[..., None]
+
+    if mode == "over":
+        color, alpha = _composite_over(colors, alphas)
+    else:
+        color, alpha = _composite_blend(colors, alphas, _BLEND_FUNCTIONS[mode])
+
+    if not premultiplied:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            color = np.where(alpha[..., None] > 0, color / alpha[..., None], 0.0)
+    result = np.concatenate((color, alpha[..., None]), axis=-1)
+    if single:
+        from spectra.core import Color
+        r, g, b, a = np.clip(result, 0.0, 1.0).tolist()
+        return Color("rgb", r, g, b, alpha=a)
+    return result
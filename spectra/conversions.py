@@ -0,0 +1,228 @@
+"""
+Vectorized color-space conversions.
+
+These kernels mirror the math (and the defaults) that `colormath` applies
+when spectra.Color converts a single color, but operate on whole NumPy
+arrays of shape (..., k) at once.
+
+Like `colormath`, CIE colors (lab, lch, xyz) created directly are taken to
+be relative to the D50 illuminant, while XYZ values derived from sRGB are
+relative to sRGB's native D65 illuminant.
+"""
+import numpy as np
+from spectra import spaces
+from spectra.spaces import DIMENSIONS, CIE_E, SOURCE_ILLUMINANT, RGB_ILLUMINANT
+
+ILLUMINANTS = dict((k, np.array(v)) for k, v in spaces.ILLUMINANTS.items())
+RGB_TO_XYZ = np.array(spaces.RGB_TO_XYZ)
+XYZ_TO_RGB = np.array(spaces.XYZ_TO_RGB)
+ADAPTATION_MATRICES = dict((k, np.array(v))
+    for k, v in spaces.ADAPTATION_MATRICES.items())
+
+def _matmul(matrix, values):
+    return np.einsum("ij,...j->...i", matrix, values)
+
+def _rgb_hue(r, g, b, v_min, v_max):
+    spread = v_max - v_min
+    safe = np.where(spread == 0, 1.0, spread)
+    return np.select(
+        [ v_max == v_min, v_max == r, v_max == g ],
+        [ 0.0,
+          (60.0 * ((g - b) / safe) + 360) % 360.0,
+          60.0 * ((b - r) / safe) + 120 ],
+        60.0 * ((r - g) / safe) + 240.0)
+
+def _lab_to_lch(values, illum):
+    l, a, b = values[..., 0], values[..., 1], values[..., 2]
+    c = np.sqrt(a ** 2 + b ** 2)
+    h = np.arctan2(b, a)
+    h = np.where(h > 0, (h / np.pi) * 180, 360 - (np.abs(h) / np.pi) * 180)
+    return np.stack((l, c, h), axis=-1), illum
+
+def _lch_to_lab(values, illum):
+    l, c, h = values[..., 0], values[..., 1], values[..., 2]
+    rad = np.radians(h)
+    return np.stack((l, np.cos(rad) * c, np.sin(rad) * c), axis=-1), illum
+
+def _lab_to_xyz(values, illum):
+    l, a, b = values[..., 0], values[..., 1], values[..., 2]
+    y = (l + 16.0) / 116.0
+    f = np.stack((a / 500.0 + y, y, y - b / 200.0), axis=-1)
+    cubed = f ** 3
+    xyz = np.where(cubed > CIE_E, cubed, (f - 16.0 / 116.0) / 7.787)
+    return xyz * ILLUMINANTS[illum], illum
+
+def _xyz_to_lab(values, illum):
+    t = values / ILLUMINANTS[illum]
+    f = np.where(t > CIE_E, np.cbrt(t), (7.787 * t) + (16.0 / 116.0))
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+    lab = (116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz))
+    return np.stack(lab, axis=-1), illum
+
+def _xyz_to_rgb(values, illum):
+    if illum != RGB_ILLUMINANT:
+        values = _matmul(ADAPTATION_MATRICES[(illum, RGB_ILLUMINANT)], values)
+    linear = np.maximum(_matmul(XYZ_TO_RGB, values), 0.0)
+    rgb = np.where(linear <= 0.0031308,
+        linear * 12.92,
+        1.055 * np.power(linear, 1 / 2.4) - 0.055)
+    return rgb, RGB_ILLUMINANT
+
+def _rgb_to_xyz(values, illum):
+    with np.errstate(invalid="ignore"):
+        linear = np.where(values <= 0.04045,
+            values / 12.92,
+            np.power((values + 0.055) / 1.055, 2.4))
+    return np.maximum(_matmul(RGB_TO_XYZ, linear), 0.0), RGB_ILLUMINANT
+
+def _rgb_to_hsl(values, illum):
+    r, g, b = values[..., 0], values[..., 1], values[..., 2]
+    v_max = np.max(values, axis=-1)
+    v_min = np.min(values, axis=-1)
+    h = _rgb_hue(r, g, b, v_min, v_max)
+    l = 0.5 * (v_max + v_min)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.select(
+            [ v_max == v_min, l <= 0.5 ],
+            [ 0.0, (v_max - v_min) / (2.0 * l) ],
+            (v_max - v_min) / (2.0 - (2.0 * l)))
+    return np.stack((h, s, l), axis=-1), illum
+
+def _hsl_component(q, p, c):
+    c = np.where(c < 0, c + 1.0, c)
+    c = np.where(c > 1, c - 1.0, c)
+    return np.select(
+        [ c < (1.0 / 6.0), c < 0.5, c < (2.0 / 3.0) ],
+        [ p + ((q - p) * 6.0 * c), q, p + ((q - p) * 6.0 * ((2.0 / 3.0) - c)) ],
+        p)
+
+def _hsl_to_rgb(values, illum):
+    h, s, l = values[..., 0], values[..., 1], values[..., 2]
+    q = np.where(l < 0.5, l * (1.0 + s), l + s - (l * s))
+    p = 2.0 * l - q
+    k = h / 360.0
+    rgb = (_hsl_component(q, p, k + (1.0 / 3.0)),
+        _hsl_component(q, p, k),
+        _hsl_component(q, p, k - (1.0 / 3.0)))
+    return np.stack(rgb, axis=-1), illum
+
+def _rgb_to_hsv(values, illum):
+    r, g, b = values[..., 0], values[..., 1], values[..., 2]
+    v_max = np.max(values, axis=-1)
+    v_min = np.min(values, axis=-1)
+    h = _rgb_hue(r, g, b, v_min, v_max)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(v_max == 0, 0.0, 1.0 - (v_min / v_max))
+    return np.stack((h, s, v_max), axis=-1), illum
+
+def _hsv_to_rgb(values, illum):
+    h, s, v = values[..., 0], values[..., 1], values[..., 2]
+    h_floored = np.floor(h)
+    sector = np.trunc(h_floored / 60) % 6
+    f = (h / 60.0) - (h_floored // 60)
+    p = v * (1.0 - s)
+    q = v * (1.0 - f * s)
+    t = v * (1.0 - (1.0 - f) * s)
+    choices = [
+        (v, t, p),
+        (q, v, p),
+        (p, v, t),
+        (p, q, v),
+        (t, p, v),
+        (v, p, q),
+    ]
+    conditions = [ sector == i for i in range(6) ]
+    rgb = [ np.select(conditions, [ c[i] for c in choices ], np.nan)
+        for i in range(3) ]
+    return np.stack(rgb, axis=-1), illum
+
+def _rgb_to_cmy(values, illum):
+    return 1.0 - values, illum
+
+def _cmy_to_rgb(values, illum):
+    return 1.0 - values, illum
+
+def _cmy_to_cmyk(values, illum):
+    k = np.minimum(np.min(values, axis=-1), 1.0)
+    denom = np.where(k == 1, 1.0, 1.0 - k)[..., None]
+    cmy = np.where((k == 1)[..., None], 0.0, (values - k[..., None]) / denom)
+    return np.concatenate((cmy, k[..., None]), axis=-1), illum
+
+def _cmyk_to_cmy(values, illum):
+    k = values[..., 3:]
+    return values[..., :3] * (1.0 - k) + k, illum
+
+EDGES = {
+    ("lab", "lch"): _lab_to_lch,
+    ("lch", "lab"): _lch_to_lab,
+    ("lab", "xyz"): _lab_to_xyz,
+    ("xyz", "lab"): _xyz_to_lab,
+    ("xyz", "rgb"): _xyz_to_rgb,
+    ("rgb", "xyz"): _rgb_to_xyz,
+    ("rgb", "hsl"): _rgb_to_hsl,
+    ("hsl", "rgb"): _hsl_to_rgb,
+    ("rgb", "hsv"): _rgb_to_hsv,
+    ("hsv", "rgb"): _hsv_to_rgb,
+    ("rgb", "cmy"): _rgb_to_cmy,
+    ("cmy", "rgb"): _cmy_to_rgb,
+    ("cmy", "cmyk"): _cmy_to_cmyk,
+    ("cmyk", "cmy"): _cmyk_to_cmy,
+}
+
+PATHS = dict((key, tuple(EDGES[step] for step in path))
+    for key, path in spaces.PATHS.items())
+
+def convert(values, from_space, to_space):
+    """
+    Convert an array of colors from one color space to another.
+
+    :param values: Array-like of shape (..., k).
+    :param str from_space: Name of the source color space.
+    :param str to_space: Name of the target color space.
+
+    :rtype: numpy.ndarray
+    :returns: A new float array of shape (..., k') in `to_space`.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.shape[-1:] != (DIMENSIONS[from_space],):
+        msg = "Color space '{0}' expects {1} values per color."
+        raise ValueError(msg.format(from_space, DIMENSIONS[from_space]))
+    illum = SOURCE_ILLUMINANT
+    for step in PATHS[(from_space, to_space)]:
+        values, illum = step(values, illum)
+    return values
+
+def clamp_rgb(values):
+    """
+    Clamp RGB values to the 0.0-1.0 range.
+
+    :param values: Array-like of shape (..., 3).
+
+    :rtype: numpy.ndarray
+    :returns: A new float array of clamped values.
+    """
+    return np.clip(np.asarray(values, dtype=float), 0.0, 1.0)
+
+def upscale_rgb(values):
+    """
+    Convert clamped RGB values to 0-255 integers.
+
+    :param values: Array-like of shape (..., 3), clamped to 0.0-1.0.
+
+    :rtype: numpy.ndarray
+    :returns: An integer array of the same shape.
+    """
+    return np.floor(0.5 + np.asarray(values, dtype=float) * 255).astype(np.int64)
+
+def hexcodes(values):
+    """
+    Format clamped RGB values as hexcodes.
+
+    :param values: Array-like of shape (N, 3), clamped to 0.0-1.0.
+
+    :rtype: list
+    :returns: A list of "#rrggbb" strings.
+    """
+    ints = upscale_rgb(values).reshape(-1, 3)
+    packed = (ints[:, 0] << 16) | (ints[:, 1] << 8) | ints[:, 2]
+    return [ "#%06x" % v for v in packed.tolist() ]
@@ -1,46 +1,347 @@
-from colormath2 import color_objects, color_conversions
-from spectra.grapefruit import Color as GC
-convert_color = color_conversions.convert_color
-
-COLOR_SPACES = {
-    "lab": color_objects.LabColor,
-    "rgb": color_objects.sRGBColor,
-    "lch": color_objects.LCHabColor,
-    "xyz": color_objects.XYZColor,
-    "hsl": color_objects.HSLColor,
-    "hsv": color_objects.HSVColor,
-    "cmy": color_objects.CMYColor,
-    "cmyk": color_objects.CMYKColor
+import bisect
+import math
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
+from spectra import engine
+from spectra.spaces import DIMENSIONS
+
+_COLORMATH_CLASSES = {
+    "lab": "LabColor",
+    "rgb": "sRGBColor",
+    "lch": "LCHabColor",
+    "xyz": "XYZColor",
+    "hsl": "HSLColor",
+    "hsv": "HSVColor",
+    "cmy": "CMYColor",
+    "cmyk": "CMYKColor"
 }
 
+class _ColorSpaces(MutableMapping):
+    """
+    Maps color-space names to `colormath` color classes.
+
+    `colormath` is only imported once a class is actually looked up.
+    Spaces added here are converted via the "colormath" engine.
+    """
+    def __init__(self, names):
+        self._names = dict(names)
+        self._classes = {}
+
+    def __getitem__(self, space):
+        if space not in self._classes:
+            from colormath2 import color_objects
+            self._classes[space] = getattr(color_objects, self._names[space])
+        return self._classes[space]
+
+    def __setitem__(self, space, color_class):
+        self._names[space] = color_class.__name__
+        self._classes[space] = color_class
+
+    def __delitem__(self, space):
+        del self._names[space]
+        self._classes.pop(space, None)
+
+    def __contains__(self, space):
+        return space in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+COLOR_SPACES = _ColorSpaces(_COLORMATH_CLASSES)
+
+CacheInfo = namedtuple("CacheInfo", [ "hits", "misses", "evictions", "maxsize", "currsize" ])
+
+class ConversionCache(object):
+    """
+    A size-bounded, least-recently-used cache of color conversions.
+
+    Keys are (engine, space, values, target space) tuples; cached entries
+    are the converted values.
+    """
+    def __init__(self, maxsize=4096):
+        """
+        :param int maxsize: Maximum number of conversions to keep.
+        """
+        if maxsize < 1:
+            raise ValueError("Cache size must be at least 1.")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self.cache_clear()
+
+    def get(self, key):
+        """
+        Look up a conversion, marking it as recently used.
+
+        :rtype: tuple or None
+        :returns: The converted values, or None on a miss.
+        """
+        try:
+            values = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return values
+
+    def put(self, key, values):
+        """
+        Store a conversion, evicting the least recently used one if full.
+        """
+        self._entries[key] = values
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def cache_info(self):
+        """
+        Report this cache's statistics.
+
+        :rtype: CacheInfo
+        :returns: A (hits, misses, evictions, maxsize, currsize) namedtuple.
+        """
+        return CacheInfo(self.hits, self.misses, self.evictions,
+            self.maxsize, len(self._entries))
+
+    def cache_clear(self):
+        """
+        Empty this cache and reset its statistics.
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+_conversion_cache = None
+
+def enable_cache(maxsize=4096):
+    """
+    Start memoizing Color.to() conversions in a bounded LRU cache.
+
+    Calling this again replaces the current cache with an empty one.
+
+    :param int maxsize: Maximum number of conversions to keep.
+
+    :rtype: ConversionCache
+    :returns: The new cache.
+    """
+    global _conversion_cache
+    _conversion_cache = ConversionCache(maxsize)
+    return _conversion_cache
+
+def disable_cache():
+    """
+    Stop memoizing Color.to() conversions, and discard the cache.
+    """
+    global _conversion_cache
+    _conversion_cache = None
+
+def cache_info():
+    """
+    Report the conversion cache's statistics.
+
+    :rtype: CacheInfo or None
+    :returns: A (hits, misses, evictions, maxsize, currsize) namedtuple,
+        or None if caching is disabled.
+    """
+    if _conversion_cache is None: return None
+    return _conversion_cache.cache_info()
+
+def cache_clear():
+    """
+    Empty the conversion cache and reset its statistics, if enabled.
+    """
+    if _conversion_cache is not None:
+        _conversion_cache.cache_clear()
+
+_HTML_CACHE_SIZE = 65536
+_html_cache = {}
+
+def _parse_html(html_string):
+    """
+    Parse a web-color name or a #rgb, #rrggbb, or #rrggbbaa hexcode,
+    ignoring any alpha channel.
+
+    :param str html_string: Web-color name or hexcode.
+
+    :rtype: tuple
+    :returns: (r, g, b) values between 0.0 and 1.0.
+    """
+    return _parse_html_rgba(html_string)[:3]
+
+def _parse_html_rgba(html_string):
+    """
+    Parse a web-color name or a #rgb, #rrggbb, or #rrggbbaa hexcode.
+
+    Results are cached by input string.
+
+    :param str html_string: Web-color name or hexcode.
+
+    :rtype: tuple
+    :returns: (r, g, b, alpha) values between 0.0 and 1.0.
+    """
+    try:
+        return _html_cache[html_string]
+    except KeyError:
+        pass
+    html = html_string.strip().lower()
+    if html.startswith("#"):
+        html = html[1:]
+    else:
+        from spectra.grapefruit import Color as GC
+        if html in GC.NAMED_COLOR:
+            html = GC.NAMED_COLOR[html][1:]
+
+    if len(html) == 6:
+        channels = html[0:2], html[2:4], html[4:6], "ff"
+    elif len(html) == 8:
+        channels = html[0:2], html[2:4], html[4:6], html[6:8]
+    elif len(html) == 3:
+        channels = [ c + c for c in html ] + [ "ff" ]
+    else:
+        raise ValueError("input #{0} is not in #RRGGBB format".format(html))
+    rgba = tuple(int(c, 16) / 255.0 for c in channels)
+
+    if len(_html_cache) >= _HTML_CACHE_SIZE:
+        _html_cache.clear()
+    _html_cache[html_string] = rgba
+    return rgba
+
 class Color(object):
     """
     Represents a color in a given color space.
+
+    Colors are immutable and hashable: they store their native values once,
+    and derive everything else (RGB values, hexcode, etc.) on demand.
     """
-    def __init__(self, space, *values):
+    __slots__ = ("_space", "_values", "_alpha", "_color_object", "_rgb",
+        "_clamped_rgb", "_hexcode")
+
+    def __init__(self, space, *values, alpha=1.0):
         """
         :param str space: Name of the color space.
+        :param float alpha: Opacity, from 0.0 (transparent) to 1.0 (opaque).
         """
-        self.values = values
-        self.space = space
-        self.color_object = COLOR_SPACES[space](*values)
-        _rgb = self.color_object if space == "rgb" else self.to("rgb").color_object
-        self.rgb = _rgb.get_value_tuple()
-        self.clamped_rgb = (_rgb.clamped_rgb_r, _rgb.clamped_rgb_g, _rgb.clamped_rgb_b)
-        self.rbg_clamped = self.clamped_rgb
+        if space not in COLOR_SPACES:
+            raise KeyError(space)
+        dimensions = DIMENSIONS.get(space)
+        if dimensions is not None and len(values) != dimensions:
+            msg = "Color space '{0}' expects {1} values, got {2}."
+            raise TypeError(msg.format(space, dimensions, len(values)))
+        if alpha == 1.0:
+            alpha = 1.0
+        else:
+            alpha = float(alpha)
+            if alpha < 0.0 or alpha > 1.0:
+                raise ValueError("Alpha must be between 0.0 and 1.0.")
+        self._values = tuple(map(float, values))
+        self._alpha = alpha
+        self._space = space
+        self._color_object = None
+        self._rgb = None
+        self._clamped_rgb = None
+        self._hexcode = None
+
+    @property
+    def space(self):
+        """
+        The name of this color's color space.
+        """
+        return self._space
+
+    @property
+    def values(self):
+        """
+        This color's values in its own color space.
+        """
+        return self._values
+
+    @property
+    def alpha(self):
+        """
+        This color's opacity, from 0.0 (transparent) to 1.0 (opaque).
+        """
+        return self._alpha
+
+    def __eq__(self, other):
+        if not isinstance(other, Color):
+            return NotImplemented
+        return (self._space == other._space and self._values == other._values
+            and self._alpha == other._alpha)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash((self._space, self._values, self._alpha))
+
+    @property
+    def color_object(self):
+        """
+        The `colormath` object for this color, created on first access.
+        """
+        if self._color_object is None:
+            self._color_object = COLOR_SPACES[self.space](*self.values)
+        return self._color_object
+
+    @property
+    def rgb(self):
+        """
+        This color's (r, g, b) values, allowed to go out of gamut.
+
+        Computed on first access and cached.
+        """
+        if self._rgb is None:
+            if self.space == "rgb":
+                self._rgb = tuple(float(v) for v in self.values)
+            else:
+                self._rgb = self.to("rgb").rgb
+        return self._rgb
+
+    @property
+    def clamped_rgb(self):
+        """
+        This color's (r, g, b) values, clamped to 0.0-1.0.
+
+        Computed on first access and cached.
+        """
+        if self._clamped_rgb is None:
+            self._clamped_rgb = tuple(min(max(v, 0.0), 1.0) for v in self.rgb)
+        return self._clamped_rgb
+
+    @property
+    def rgba(self):
+        """
+        This color's clamped (r, g, b) values, plus its alpha.
+        """
+        return self.clamped_rgb + (self._alpha,)
+
+    @property
+    def rbg_clamped(self):
+        """
+        Alias of `clamped_rgb`.
+        """
+        return self.clamped_rgb
 
     @classmethod
     def from_html(cls, html_string):
         """
         Create sRGB color from a web-color name or hexcode.
 
+        Eight-digit hexcodes (#rrggbbaa) set the color's alpha.
+
         :param str html_string: Web-color name or hexcode.
 
         :rtype: Color
         :returns: A spectra.Color in the sRGB color space.
         """
-        rgb = GC.NewFromHtml(html_string).rgb
-        return cls("rgb", *rgb)
+        r, g, b, alpha = _parse_html_rgba(html_string)
+        return cls("rgb", r, g, b, alpha=alpha)
 
     def to(self, space):
         """
@@ -52,8 +353,13 @@ class Color(object):
         :returns: A new spectra.Color in the given color space.
         """
         if space == self.space: return self
-        new_color = convert_color(self.color_object, COLOR_SPACES[space])
-        return self.__class__(space, *new_color.get_value_tuple())
+        cache = _conversion_cache
+        key = (engine.get_engine(), self.space, self.values, space)
+        values = None if cache is None else cache.get(key)
+        if values is None:
+            values = engine.convert(self.space, self.values, space)
+            if cache is not None: cache.put(key, values)
+        return self.__class__(space, *values, alpha=self._alpha)
 
     @property
     def hexcode(self):
@@ -63,13 +369,30 @@ class Color(object):
         :rtype: str
         :returns: A six-character string.
         """
-        return COLOR_SPACES["rgb"](*self.clamped_rgb).get_rgb_hex()
+        if self._hexcode is None:
+            ints = tuple(int(math.floor(0.5 + v * 255)) for v in self.clamped_rgb)
+            self._hexcode = "#%02x%02x%02x" % ints
+        return self._hexcode
+
+    def nearest_name(self):
+        """
+        Find the web-color name closest to this color.
+
+        Closeness is measured by Euclidean distance in Lab (i.e., CIE1976
+        Delta E).
+
+        :rtype: str
+        :returns: A web-color name, e.g. "papayawhip".
+        """
+        from spectra.names import nearest_names
+        return nearest_names([ self ])[0]
 
     def blend(self, other, ratio=0.5):
         """
         Blend this color with another color in the same color space.
 
-        By default, blends the colors half-and-half (ratio: 0.5).
+        By default, blends the colors half-and-half (ratio: 0.5). Alpha is
+        blended, too.
 
         :param Color other: The color to blend.
         :param float ratio: How much to blend (0 -> 1).
@@ -82,7 +405,8 @@ class Color(object):
             raise Exception("Colors must belong to the same color space.")
         values = tuple(((u * keep) + (v * ratio)
             for u, v in zip(self.values, other.values)))
-        return self.__class__(self.space, *values)
+        alpha = (self._alpha * keep) + (other._alpha * ratio)
+        return self.__class__(self.space, *values, alpha=alpha)
 
     def brighten(self, amount=10):
         """
@@ -98,7 +422,7 @@ class Color(object):
         """
         lch = self.to("lch")
         l, c, h = lch.values
-        new_lch = self.__class__("lch", l + amount, c, h)
+        new_lch = self.__class__("lch", l + amount, c, h, alpha=self._alpha)
         return new_lch.to(self.space)
 
     def darken(self, amount=10):
@@ -129,7 +453,7 @@ class Color(object):
         """
         lch = self.to("lch")
         l, c, h = lch.values
-        new_lch = self.__class__("lch", l, c + amount, h)
+        new_lch = self.__class__("lch", l, c + amount, h, alpha=self._alpha)
         return new_lch.to(self.space)
 
     def desaturate(self, amount=10):
@@ -146,6 +470,90 @@ class Color(object):
         """
         return self.saturate(amount=-amount)
 
+    def complementary(self, mode="ryb"):
+        """
+        Find this color's complementary color.
+
+        :param str mode: Color wheel to use: "ryb" or "rgb".
+
+        :rtype: Color
+        :returns: A new spectra.Color
+        """
+        from spectra.harmony import complementary
+        return complementary(self, mode)
+
+    def triadic(self, angle=120, mode="ryb"):
+        """
+        Find the two colors forming a triad (or, for angles under 120, a
+        split complementary) with this color.
+
+        :param float angle: The angle between the new colors' hues.
+        :param str mode: Color wheel to use: "ryb" or "rgb".
+
+        :rtype: tuple
+        :returns: Two new spectra.Color objects.
+        """
+        from spectra.harmony import triadic
+        return triadic(self, angle, mode)
+
+    def tetradic(self, angle=30, mode="ryb"):
+        """
+        Find the three colors forming a tetrad with this color.
+
+        :param float angle: The angle to subtract from the adjacent colors'
+            hues (-90 -> 90).
+        :param str mode: Color wheel to use: "ryb" or "rgb".
+
+        :rtype: tuple
+        :returns: Three new spectra.Color objects.
+        """
+        from spectra.harmony import tetradic
+        return tetradic(self, angle, mode)
+
+    def analogous(self, angle=30, mode="ryb"):
+        """
+        Find the two colors analogous to this color.
+
+        :param float angle: The angle between the new colors' hues and this one's.
+        :param str mode: Color wheel to use: "ryb" or "rgb".
+
+        :rtype: tuple
+        :returns: Two new spectra.Color objects.
+        """
+        from spectra.harmony import analogous
+        return analogous(self, angle, mode)
+
+    def monochrome(self):
+        """
+        Find four colors in this color's hue, with varying saturation and
+        lightness.
+
+        :rtype: tuple
+        :returns: Four new spectra.Color objects.
+        """
+        from spectra.harmony import monochrome
+        return monochrome(self)
+
+def _find_segment(domain, number):
+    """
+    Find the domain segment containing `number`, via binary search.
+
+    Returns the segment's index and `number`'s position within it (0 -> 1).
+    """
+    if number < domain[0] or number > domain[-1]:
+        msg = "Number ({0}) not in domain ({1} -> {2})."
+        raise ValueError(msg.format(number, domain[0], domain[-1]))
+    i = min(bisect.bisect_left(domain, number, 1), len(domain) - 1) - 1
+    x0, x1 = domain[i], domain[i+1]
+    return i, float(number - x0) / (x1 - x0)
+
+def _check_policy(out_of_domain):
+    if out_of_domain not in ("raise", "clip", "mask"):
+        raise ValueError("Unknown out_of_domain policy: '{0}'".format(out_of_domain))
+
+_ARC_TABLE_SIZE = 1024
+_ARC_CHUNK_SIZE = 1024
+
 class Scale(object):
     """
     Represents a color scale.
@@ -167,6 +575,10 @@ class Scale(object):
         # Check whether domain is correct length.
         if len(self._domain) != n:
             raise ValueError("len(domain) must equal len(colors)")
+        if any(x1 <= x0 for x0, x1 in zip(self._domain[:-1], self._domain[1:])):
+            raise ValueError("domain must be strictly increasing")
+
+        self._arc_lengths = None
 
     def __call__(self, number):
         """
@@ -177,16 +589,204 @@ class Scale(object):
         :rtype: Color
         :returns: A spectra.Color
         """
-        if number < self._domain[0] or number > self._domain[-1]:
+        i, prop = _find_segment(self._domain, number)
+        return self.colors[i].blend(self.colors[i+1], prop)
+
+    def map(self, values, output="hex", out_of_domain="raise", mask_color=None):
+        """
+        Return the colors corresponding to many numbers at once.
+
+        The whole batch is interpolated and converted in a single NumPy pass.
+        Numbers outside the domain (and NaNs) are handled by the
+        `out_of_domain` policy: "raise" raises a ValueError, "clip" clamps
+        numbers to the domain, and "mask" maps them to `mask_color` (for
+        hexcodes) or to NaN (for "rgb", "rgba", and "array" outputs). NaNs
+        are masked under the "clip" policy, too. Hexcode output with masked
+        numbers requires a `mask_color`.
+
+        :param values: List, iterator, or 1-D NumPy array of numbers.
+        :param str output: "hex", "rgb", "rgba", or "array".
+        :param str out_of_domain: "raise", "clip", or "mask".
+        :param mask_color: Hexcode for masked numbers, when output="hex".
+        :type mask_color: str or None
+
+        :rtype: list, numpy.ndarray, or ColorArray
+        :returns: A list of hexcodes, an (N, 3) array of clamped RGB values,
+            an (N, 4) array of clamped RGB values and alphas, or a
+            spectra.ColorArray in this scale's color space.
+        """
+        import numpy as np
+        from spectra import conversions
+        if output not in ("hex", "rgb", "rgba", "array"):
+            raise ValueError("Unknown output: '{0}'".format(output))
+        _check_policy(out_of_domain)
+        if not hasattr(values, "__len__"):
+            values = list(values)
+        numbers = np.asarray(values, dtype=float).ravel()
+        numbers, invalid = self._check_numbers(numbers, out_of_domain)
+
+        interpolated = self._interpolate(numbers)
+        interpolated[invalid] = np.nan
+        if output == "array":
+            from spectra.array import ColorArray
+            alphas = self._interpolate_alpha(numbers)
+            if alphas is not None:
+                alphas[invalid] = np.nan
+            return ColorArray(self.colors[0].space, interpolated, alphas)
+
+        if output == "hex" and mask_color is None and invalid.any():
+            msg = "Number ({0}) was masked, but no mask_color was given."
+            raise ValueError(msg.format(numbers[invalid][0]))
+        rgb = conversions.convert(interpolated, self.colors[0].space, "rgb")
+        clamped = conversions.clamp_rgb(rgb)
+        if output == "rgb":
+            return clamped
+        if output == "rgba":
+            alphas = self._interpolate_alpha(numbers)
+            if alphas is None:
+                alphas = np.ones(len(numbers))
+            alphas[invalid] = np.nan
+            return np.column_stack((clamped, alphas))
+        hexcodes = conversions.hexcodes(np.where(invalid[:, None], 0.0, clamped))
+        for i in np.flatnonzero(invalid).tolist():
+            hexcodes[i] = mask_color
+        return hexcodes
+
+    def apply_raster(self, array, out=None, dtype="uint8", alpha=False,
+            out_of_domain="raise", chunk_rows=None):
+        """
+        Color-map a 2-D array of numbers into an RGB(A) image buffer.
+
+        Pixels are written directly into `out` (allocated if not given),
+        `chunk_rows` rows at a time, so no per-pixel Python objects or
+        full-size temporary arrays are created. The result has shape
+        (height, width, 3), or (height, width, 4) if `alpha` is True, and
+        can be passed to e.g. PIL's Image.fromarray or matplotlib's imshow.
+        The alpha channel is interpolated between the scale's colors'
+        alphas.
+
+        Integer buffers receive values scaled to the dtype's full range
+        (e.g. 0-255 for uint8); float buffers receive 0.0-1.0. See
+        Scale.map for `out_of_domain`; masked pixels are written as zeros
+        (fully transparent, if `alpha` is True).
+
+        :param array: 2-D array-like of numbers.
+        :param out: Array of shape (height, width, 3 or 4) to write into.
+        :param dtype: dtype of the buffer to allocate, if `out` is not given.
+        :param bool alpha: Whether to write an alpha channel.
+        :param str out_of_domain: "raise", "clip", or "mask".
+        :param chunk_rows: Rows to process at a time.
+        :type chunk_rows: int or None
+
+        :rtype: numpy.ndarray
+        :returns: The image buffer, `out`.
+        """
+        import numpy as np
+        from spectra import conversions
+        _check_policy(out_of_domain)
+        array = np.asarray(array)
+        if array.ndim != 2:
+            raise ValueError("apply_raster expects a 2-D array.")
+        height, width = array.shape
+        channels = 4 if alpha else 3
+        if out is None:
+            out = np.empty((height, width, channels), dtype=dtype)
+        elif out.shape != (height, width, channels):
+            msg = "out must have shape ({0}, {1}, {2})"
+            raise ValueError(msg.format(height, width, channels))
+
+        if np.issubdtype(out.dtype, np.integer):
+            max_value = np.iinfo(out.dtype).max
+        else:
+            max_value = None
+        if chunk_rows is None:
+            chunk_rows = max(1, (1 << 16) // max(width, 1))
+        chunks = [ (start, min(start + chunk_rows, height))
+            for start in range(0, height, chunk_rows) ]
+
+        # Validate everything before writing anything.
+        if out_of_domain == "raise":
+            for start, stop in chunks:
+                self._check_numbers(array[start:stop].astype(float).ravel(), "raise")
+
+        space = self.colors[0].space
+        for start, stop in chunks:
+            numbers = array[start:stop].astype(float).ravel()
+            numbers, invalid = self._check_numbers(numbers, out_of_domain)
+            rgb = conversions.clamp_rgb(conversions.convert(
+                self._interpolate(numbers), space, "rgb"))
+            rgb[invalid] = 0.0
+            alphas = self._interpolate_alpha(numbers)
+            opacity = np.where(invalid, 0.0, 1.0 if alphas is None else alphas)
+            if max_value is not None:
+                rgb = np.floor(0.5 + rgb * max_value)
+                opacity = np.floor(0.5 + opacity * max_value)
+            out[start:stop, :, :3] = rgb.reshape(stop - start, width, 3)
+            if alpha:
+                out[start:stop, :, 3] = opacity.reshape(stop - start, width)
+        return out
+
+    def _check_numbers(self, numbers, out_of_domain):
+        """
+        Apply an out-of-domain policy to an array of numbers.
+
+        Returns the (possibly clipped) numbers, and a mask of the numbers
+        still outside the domain.
+        """
+        import numpy as np
+        lo, hi = self._domain[0], self._domain[-1]
+        if out_of_domain == "clip":
+            numbers = np.clip(numbers, lo, hi)
+        invalid = ~((numbers >= lo) & (numbers <= hi))
+        if out_of_domain == "raise" and invalid.any():
             msg = "Number ({0}) not in domain ({1} -> {2})."
-            raise ValueError(msg.format(number, self._domain[0], self._domain[-1]))
-        segments = zip(self._domain[:-1], self._domain[1:])
-        for i, seg in enumerate(segments):
-            x0, x1 = seg
-            if number >= x0 and number <= x1:
-                num_range = x1 - x0
-                prop = float(number - x0) / num_range
-                return self.colors[i].blend(self.colors[i+1], prop)
+            raise ValueError(msg.format(numbers[invalid][0], lo, hi))
+        return numbers, invalid
+
+    def _interpolate(self, numbers):
+        """
+        Interpolate an array of in-domain numbers between this scale's colors.
+        """
+        import numpy as np
+        space = self.colors[0].space
+        if any(c.space != space for c in self.colors):
+            raise Exception("Colors must belong to the same color space.")
+        domain = np.asarray(self._domain, dtype=float)
+        points = np.array([ c.values for c in self.colors ], dtype=float)
+        i = np.clip(np.searchsorted(domain, numbers, side="left"),
+            1, len(domain) - 1) - 1
+        x0, x1 = domain[i], domain[i + 1]
+        prop = ((numbers - x0) / (x1 - x0))[:, None]
+        return (points[i] * (1.0 - prop)) + (points[i + 1] * prop)
+
+    def _interpolate_alpha(self, numbers):
+        """
+        Interpolate an array of in-domain numbers between this scale's
+        colors' alphas, or return None if every color is opaque.
+        """
+        import numpy as np
+        alphas = [ c.alpha for c in self.colors ]
+        if all(a == 1.0 for a in alphas):
+            return None
+        return np.interp(numbers, self._domain, alphas)
+
+    def compile(self, resolution=None):
+        """
+        Create a compiled, read-only version of this scale.
+
+        Compiled scales locate a number's segment by binary search and keep
+        each segment's endpoint values ready for interpolation. If
+        `resolution` is given, they also precompute a lookup table of that
+        many evenly spaced hexcodes, so `compiled.hexcode(number)` is a
+        single table lookup.
+
+        :param resolution: Size of the hexcode lookup table.
+        :type resolution: int or None
+
+        :rtype: CompiledScale
+        :returns: A new spectra.CompiledScale object.
+        """
+        return CompiledScale(self, resolution)
 
     def domain(self, domain):
         """
@@ -220,19 +820,200 @@ class Scale(object):
         new_colors = [ c.to(space) for c in self.colors ]
         return self.__class__(new_colors, self._domain)
 
-    def range(self, count):
+    def range(self, count, uniform=False):
         """
-        Create a list of colors evenly spaced along this scale's domain.
+        Create a list of colors evenly spaced along this scale.
+
+        By default, colors are evenly spaced along the scale's domain. If
+        `uniform` is True, they are instead evenly spaced in perceived
+        color, measured by the CIEDE2000 color difference. (The table of
+        cumulative differences this requires is computed once per scale,
+        and reused by later calls.)
 
         :param int count: The number of colors to return.
+        :param bool uniform: Space colors perceptually, not by domain.
 
         :rtype: list
         :returns: A list of spectra.Color objects.
         """
+        return list(self.iter_range(count, uniform=uniform))
+
+    def iter_range(self, count, chunk=None, uniform=False):
+        """
+        Lazily generate colors evenly spaced along this scale.
+
+        Colors are computed as they are consumed, so memory use doesn't
+        grow with `count`. If `chunk` is given, yields spectra.ColorArray
+        objects of (up to) `chunk` colors each, computed in bulk. See
+        Scale.range for `uniform`.
+
+        :param int count: The number of colors to generate.
+        :param chunk: The number of colors per ColorArray.
+        :type chunk: int or None
+        :param bool uniform: Space colors perceptually, not by domain.
+
+        :rtype: iterator
+        :returns: An iterator of spectra.Color or spectra.ColorArray objects.
+        """
         if count <= 1:
             raise ValueError("Range size must be greater than 1.")
+        if chunk is not None and chunk < 1:
+            raise ValueError("Chunk size must be at least 1.")
+        if chunk is None:
+            return self._iter_colors(count, uniform)
+        return self._iter_chunks(count, chunk, uniform)
+
+    def _iter_colors(self, count, uniform):
+        if uniform:
+            for numbers in self._iter_positions(count, _ARC_CHUNK_SIZE, uniform):
+                for number in numbers.tolist():
+                    yield self(number)
+            return
         dom = self._domain
         distance = dom[-1] - dom[0]
-        props = [ self(dom[0] + distance * float(x)/(count-1))
-            for x in range(count) ]
-        return props
+        for x in range(count):
+            yield self(dom[0] + distance * float(x)/(count-1))
+
+    def _iter_chunks(self, count, chunk, uniform):
+        from spectra.array import ColorArray
+        space = self.colors[0].space
+        for numbers in self._iter_positions(count, chunk, uniform):
+            yield ColorArray(space, self._interpolate(numbers),
+                self._interpolate_alpha(numbers))
+
+    def _iter_positions(self, count, chunk, uniform):
+        """
+        Generate the domain positions of a range, `chunk` at a time.
+        """
+        import numpy as np
+        dom = self._domain
+        distance = dom[-1] - dom[0]
+        for start in range(0, count, chunk):
+            fractions = np.arange(start, min(start + chunk, count)) / float(count - 1)
+            if uniform:
+                numbers = self._arc_positions(fractions)
+            else:
+                numbers = dom[0] + distance * fractions
+            yield np.clip(numbers, dom[0], dom[-1])
+
+    def _arc_positions(self, fractions):
+        """
+        Find the domain positions at the given fractions of this scale's
+        perceptual (CIEDE2000) length, by binary search of the arc table.
+        """
+        import numpy as np
+        samples, lengths = self._arc_table()
+        total = lengths[-1]
+        if total == 0:
+            return samples[0] + (samples[-1] - samples[0]) * fractions
+        targets = fractions * total
+        i = np.clip(np.searchsorted(lengths, targets, side="right"),
+            1, len(lengths) - 1) - 1
+        step = lengths[i + 1] - lengths[i]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            prop = np.where(step > 0, (targets - lengths[i]) / step, 0.0)
+        return samples[i] + (samples[i + 1] - samples[i]) * prop
+
+    def _arc_table(self):
+        """
+        Build (once) the table of cumulative CIEDE2000 differences along
+        this scale, sampled at _ARC_TABLE_SIZE points plus each color stop.
+        """
+        import numpy as np
+        from spectra import conversions, difference
+        if self._arc_lengths is None:
+            dom = self._domain
+            samples = np.union1d(np.linspace(dom[0], dom[-1], _ARC_TABLE_SIZE), dom)
+            lab = conversions.convert(self._interpolate(samples),
+                self.colors[0].space, "lab")
+            steps = difference.delta_e_cie2000(lab[:-1], lab[1:])
+            lengths = np.concatenate(([ 0.0 ], np.cumsum(steps)))
+            self._arc_lengths = (samples, lengths)
+        return self._arc_lengths
+
+class CompiledScale(object):
+    """
+    Represents a precompiled color scale, for fast repeated lookups.
+
+    Created via Scale.compile().
+    """
+    def __init__(self, scale, resolution=None):
+        """
+        :param Scale scale: The scale to compile.
+        :param resolution: Size of the hexcode lookup table.
+        :type resolution: int or None
+        """
+        from spectra import conversions
+        colors = scale.colors
+        space = colors[0].space
+        if any(c.space != space for c in colors):
+            raise Exception("Colors must belong to the same color space.")
+        self.space = space
+        self._domain = [ float(x) for x in scale.get_domain() ]
+        self._starts = [ c.values for c in colors[:-1] ]
+        self._ends = [ c.values for c in colors[1:] ]
+        self._alphas = [ c.alpha for c in colors ]
+
+        self.resolution = resolution
+        self._table = None
+        if resolution is not None:
+            if resolution <= 1:
+                raise ValueError("Resolution must be greater than 1.")
+            lo, hi = self._domain[0], self._domain[-1]
+            self._offset = lo
+            self._step = (hi - lo) / (resolution - 1)
+            samples = [ self.values(lo + self._step * x)
+                for x in range(resolution) ]
+            rgb = conversions.convert(samples, space, "rgb")
+            self._table = conversions.hexcodes(conversions.clamp_rgb(rgb))
+
+    def values(self, number):
+        """
+        Return the color values corresponding to the given `number`.
+
+        :param float number: The number to color-ify.
+
+        :rtype: tuple
+        :returns: Values in this scale's color space.
+        """
+        i, prop = _find_segment(self._domain, number)
+        keep = 1.0 - prop
+        return tuple(((u * keep) + (v * prop)
+            for u, v in zip(self._starts[i], self._ends[i])))
+
+    def __call__(self, number):
+        """
+        Return the color corresponding to the given `number`.
+
+        :param float number: The number to color-ify.
+
+        :rtype: Color
+        :returns: A spectra.Color
+        """
+        i, prop = _find_segment(self._domain, number)
+        keep = 1.0 - prop
+        values = ((u * keep) + (v * prop)
+            for u, v in zip(self._starts[i], self._ends[i]))
+        alpha = (self._alphas[i] * keep) + (self._alphas[i+1] * prop)
+        return Color(self.space, *values, alpha=alpha)
+
+    def hexcode(self, number):
+        """
+        Return the hexcode corresponding to the given `number`.
+
+        When this scale has a lookup table, returns the hexcode of the
+        nearest precomputed sample.
+
+        :param float number: The number to color-ify.
+
+        :rtype: str
+        :returns: A six-character string.
+        """
+        if self._table is None:
+            return self(number).hexcode
+        if number < self._domain[0] or number > self._domain[-1]:
+            msg = "Number ({0}) not in domain ({1} -> {2})."
+            raise ValueError(msg.format(number, self._domain[0], self._domain[-1]))
+        if self._step == 0:
+            return self._table[0]
+        return self._table[int((number - self._offset) / self._step + 0.5)]
@@ -0,0 +1,184 @@
+"""
+Vectorized color-difference (Delta E) formulas.
+
+These follow `colormath`'s color_diff_matrix implementations, but accept
+Lab arrays of any broadcastable shapes (..., 3).
+"""
+import numpy as np
+
+def delta_e_cie1976(lab1, lab2):
+    """
+    Calculate the Delta E (CIE1976) between two arrays of Lab colors.
+
+    :param lab1: Array-like of shape (..., 3).
+    :param lab2: Array-like of shape (..., 3), broadcastable with `lab1`.
+
+    :rtype: numpy.ndarray
+    :returns: The broadcast array of differences.
+    """
+    lab1 = np.asarray(lab1, dtype=float)
+    lab2 = np.asarray(lab2, dtype=float)
+    return np.sqrt(np.sum((lab1 - lab2) ** 2, axis=-1))
+
+def delta_e_cie1994(lab1, lab2, K_L=1, K_C=1, K_H=1, K_1=0.045, K_2=0.015):
+    """
+    Calculate the Delta E (CIE1994) between two arrays of Lab colors.
+
+    As in `colormath`, `lab1` is the reference color, so the formula is
+    not symmetric.
+
+    :param lab1: Array-like of shape (..., 3).
+    :param lab2: Array-like of shape (..., 3), broadcastable with `lab1`.
+
+    :rtype: numpy.ndarray
+    :returns: The broadcast array of differences.
+    """
+    lab1 = np.asarray(lab1, dtype=float)
+    lab2 = np.asarray(lab2, dtype=float)
+    C_1 = np.sqrt(lab1[..., 1] ** 2 + lab1[..., 2] ** 2)
+    C_2 = np.sqrt(lab2[..., 1] ** 2 + lab2[..., 2] ** 2)
+    delta_lab = lab1 - lab2
+    delta_L = delta_lab[..., 0]
+    delta_C = C_1 - C_2
+    delta_H_sq = delta_lab[..., 1] ** 2 + delta_lab[..., 2] ** 2 - delta_C ** 2
+    delta_H = np.sqrt(np.clip(delta_H_sq, 0, None))
+    S_L = 1
+    S_C = 1 + K_1 * C_1
+    S_H = 1 + K_2 * C_1
+    return np.sqrt(
+        (delta_L / (K_L * S_L)) ** 2
+        + (delta_C / (K_C * S_C)) ** 2
+        + (delta_H / (K_H * S_H)) ** 2)
+
+def delta_e_cie2000(lab1, lab2, Kl=1, Kc=1, Kh=1):
+    """
+    Calculate the Delta E (CIE2000) between two arrays of Lab colors.
+
+    :param lab1: Array-like of shape (..., 3).
+    :param lab2: Array-like of shape (..., 3), broadcastable with `lab1`.
+
+    :rtype: numpy.ndarray
+    :returns: The broadcast array of differences.
+    """
+    lab1 = np.asarray(lab1, dtype=float)
+    lab2 = np.asarray(lab2, dtype=float)
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    avg_Lp = (L1 + L2) / 2.0
+    C1 = np.sqrt(a1 ** 2 + b1 ** 2)
+    C2 = np.sqrt(a2 ** 2 + b2 ** 2)
+    avg_C1_C2 = (C1 + C2) / 2.0
+    G = 0.5 * (1 - np.sqrt(avg_C1_C2 ** 7.0 / (avg_C1_C2 ** 7.0 + 25.0 ** 7.0)))
+
+    a1p = (1.0 + G) * a1
+    a2p = (1.0 + G) * a2
+    C1p = np.sqrt(a1p ** 2 + b1 ** 2)
+    C2p = np.sqrt(a2p ** 2 + b2 ** 2)
+    avg_C1p_C2p = (C1p + C2p) / 2.0
+
+    h1p = np.degrees(np.arctan2(b1, a1p))
+    h1p = h1p + (h1p < 0) * 360
+    h2p = np.degrees(np.arctan2(b2, a2p))
+    h2p = h2p + (h2p < 0) * 360
+
+    avg_Hp = (((np.fabs(h1p - h2p) > 180) * 360) + h1p + h2p) / 2.0
+    T = (1
+        - 0.17 * np.cos(np.radians(avg_Hp - 30))
+        + 0.24 * np.cos(np.radians(2 * avg_Hp))
+        + 0.32 * np.cos(np.radians(3 * avg_Hp + 6))
+        - 0.2 * np.cos(np.radians(4 * avg_Hp - 63)))
+
+    diff_h2p_h1p = h2p - h1p
+    delta_hp = diff_h2p_h1p + (np.fabs(diff_h2p_h1p) > 180) * 360
+    delta_hp = delta_hp - (h2p > h1p) * 720
+
+    delta_Lp = L2 - L1
+    delta_Cp = C2p - C1p
+    delta_Hp = 2 * np.sqrt(C2p * C1p) * np.sin(np.radians(delta_hp) / 2.0)
+
+    S_L = 1 + ((0.015 * (avg_Lp - 50) ** 2) / np.sqrt(20 + (avg_Lp - 50) ** 2.0))
+    S_C = 1 + 0.045 * avg_C1p_C2p
+    S_H = 1 + 0.015 * avg_C1p_C2p * T
+
+    delta_ro = 30 * np.exp(-(((avg_Hp - 275) / 25) ** 2.0))
+    R_C = np.sqrt(avg_C1p_C2p ** 7.0 / (avg_C1p_C2p ** 7.0 + 25.0 ** 7.0))
+    R_T = -2 * R_C * np.sin(2 * np.radians(delta_ro))
+
+    return np.sqrt(
+        (delta_Lp / (S_L * Kl)) ** 2
+        + (delta_Cp / (S_C * Kc)) ** 2
+        + (delta_Hp / (S_H * Kh)) ** 2
+        + R_T * (delta_Cp / (S_C * Kc)) * (delta_Hp / (S_H * Kh)))
+
+METHODS = {
+    "cie1976": delta_e_cie1976,
+    "cie1994": delta_e_cie1994,
+    "cie2000": delta_e_cie2000,
+}
+
+def _lab_values(colors):
+    from spectra.array import as_color_array
+    from spectra.core import Color
+    if isinstance(colors, np.ndarray):
+        return colors.astype(float)
+    if isinstance(colors, Color):
+        return np.array(colors.to("lab").values, dtype=float)
+    return as_color_array(colors, "lab").values
+
+def _method(method):
+    try:
+        return METHODS[method]
+    except KeyError:
+        raise ValueError("Unknown Delta E method: '{0}'".format(method))
+
+def delta_e(a, b, method="cie2000"):
+    """
+    Calculate the color difference (Delta E) between colors.
+
+    `a` and `b` can each be a spectra.Color, a list of spectra.Color
+    objects, a spectra.ColorArray, or a NumPy array of Lab values; they are
+    broadcast against each other, NumPy-style.
+
+    :param a: The reference color(s).
+    :param b: The color(s) to compare.
+    :param str method: "cie1976", "cie1994", or "cie2000".
+
+    :rtype: float or numpy.ndarray
+    :returns: The difference(s) between `a` and `b`.
+    """
+    result = _method(method)(_lab_values(a), _lab_values(b))
+    return float(result) if np.ndim(result) == 0 else result
+
+def delta_e_matrix(colors, others=None, method="cie2000", chunk_size=None, out=None):
+    """
+    Calculate the color differences between all pairs of colors.
+
+    Rows are computed `chunk_size` at a time, so temporary memory stays
+    bounded; pass `out` (e.g. a numpy.memmap) to bound the result's, too.
+
+    :param colors: A list of spectra.Color objects, a spectra.ColorArray,
+        or an (N, 3) NumPy array of Lab values.
+    :param others: The colors to compare against. Defaults to `colors`.
+    :param str method: "cie1976", "cie1994", or "cie2000".
+    :param chunk_size: Rows per chunk. Defaults to ~1M pairs per chunk.
+    :type chunk_size: int or None
+    :param out: An (N, M) array to write the differences into.
+
+    :rtype: numpy.ndarray
+    :returns: An (N, M) array; entry (i, j) compares colors[i] to others[j].
+    """
+    func = _method(method)
+    lab1 = _lab_values(colors).reshape(-1, 3)
+    lab2 = lab1 if others is None else _lab_values(others).reshape(-1, 3)
+    n, m = len(lab1), len(lab2)
+    if out is None:
+        out = np.empty((n, m))
+    elif out.shape != (n, m):
+        raise ValueError("out must have shape ({0}, {1})".format(n, m))
+    if chunk_size is None:
+        chunk_size = max(1, (1 << 20) // max(m, 1))
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        out[start:stop] = func(lab1[start:stop, None, :], lab2[None, :, :])
+    return out
@@ -0,0 +1,203 @@
+"""
+Vectorized palette reduction and dithering for RGB images.
+
+Images are (height, width, 3) arrays: floats in 0.0-1.0, or integers
+spanning their dtype's range (e.g. 0-255 for uint8). They can be reduced
+to the 216-color web-safe palette, or to any palette of colors, by:
+
+- "nearest": mapping each pixel to its nearest palette color.
+- "ordered": adding a tiled Bayer threshold matrix first, which trades
+  banding for a regular, fine-grained pattern. Fully vectorized.
+- "floyd-steinberg": diffusing each pixel's error onto its unvisited
+  neighbors. Pixels are visited in the usual row-by-row order; since each
+  pixel only depends on pixels above it or to its left, pixels along the
+  same skewed diagonal (x + 2y) are independent, and are processed
+  together.
+"""
+import numpy as np
+
+METHODS = ("nearest", "ordered", "floyd-steinberg")
+
+_WEBSAFE_LEVELS = np.linspace(0.0, 1.0, 6)
+
+WEBSAFE_PALETTE = np.array([ (r, g, b)
+    for r in _WEBSAFE_LEVELS
+    for g in _WEBSAFE_LEVELS
+    for b in _WEBSAFE_LEVELS ])
+
+_PAIRS_PER_CHUNK = 1 << 20
+
+def websafe(rgb, alt=False):
+    """
+    Find the nearest web-safe equivalent of many RGB colors.
+
+    The array version of grapefruit's Color.RgbToWebSafe.
+
+    :param rgb: Array-like of shape (..., 3), in 0.0-1.0.
+    :param bool alt: If True, return the other of the two web-safe values
+        nearest each component (as grapefruit's WebSafeDither does).
+
+    :rtype: numpy.ndarray
+    """
+    rgb = np.asarray(rgb, dtype=float)
+    scaled = np.round(rgb * 100.0, 9) / 20.0
+    lower = np.floor(scaled)
+    upper_is_nearer = (scaled - lower) >= 0.5
+    if alt:
+        upper_is_nearer = ~upper_is_nearer
+    safe = np.where(upper_is_nearer, lower + 1, lower) / 5.0
+    return np.where(scaled == lower, rgb, safe)
+
+def bayer_matrix(size):
+    """
+    Create a Bayer threshold matrix.
+
+    :param int size: Width and height of the matrix; a power of two.
+
+    :rtype: numpy.ndarray
+    :returns: A (size, size) array of the integers 0 -> size**2 - 1.
+    """
+    if size < 2 or size & (size - 1):
+        raise ValueError("Bayer matrix size must be a power of two.")
+    matrix = np.array([ [ 0, 2 ], [ 3, 1 ] ])
+    while len(matrix) < size:
+        matrix = np.block([ [ 4 * matrix, 4 * matrix + 2 ],
+            [ 4 * matrix + 3, 4 * matrix + 1 ] ])
+    return matrix
+
+class _Palette(object):
+    """
+    Finds the nearest palette color for many RGB values.
+    """
+    def __init__(self, palette):
+        if isinstance(palette, str):
+            if palette != "websafe":
+                raise ValueError("Unknown palette: '{0}'".format(palette))
+            self.colors = WEBSAFE_PALETTE
+            self.websafe = True
+        else:
+            self.colors = _palette_rgb(palette)
+            self.websafe = False
+        self._norms = np.sum(self.colors ** 2, axis=1)
+
+    def spread(self):
+        """
+        The median distance between neighboring palette colors.
+        """
+        if self.websafe:
+            return 0.2
+        if len(self.colors) < 2:
+            return 0.0
+        diff = self.colors[:, None, :] - self.colors[None, :, :]
+        dist = np.sqrt(np.sum(diff ** 2, axis=-1))
+        np.fill_diagonal(dist, np.inf)
+        return float(np.median(dist.min(axis=1)))
+
+    def nearest(self, values):
+        """
+        Find the index of the nearest palette color to each (..., 3) value.
+        """
+        if self.websafe:
+            levels = np.clip(np.floor(values * 5 + 0.5), 0, 5).astype(np.intp)
+            return levels[..., 0] * 36 + levels[..., 1] * 6 + levels[..., 2]
+        flat = values.reshape(-1, 3)
+        indices = np.empty(len(flat), dtype=np.intp)
+        chunk = max(1, _PAIRS_PER_CHUNK // len(self.colors))
+        for start in range(0, len(flat), chunk):
+            part = flat[start:start + chunk]
+            # Squared distances, less the (constant per row) |part|^2 term.
+            dist = self._norms - 2 * np.dot(part, self.colors.T)
+            indices[start:start + chunk] = np.argmin(dist, axis=1)
+        return indices.reshape(values.shape[:-1])
+
+def _palette_rgb(palette):
+    from spectra.array import ColorArray, as_color_array
+    if isinstance(palette, np.ndarray):
+        colors = palette.astype(float)
+    elif isinstance(palette, ColorArray):
+        colors = palette.clamped_rgb
+    else:
+        from spectra.core import Color
+        colors = as_color_array([ c if isinstance(c, Color) else Color.from_html(c)
+            for c in palette ], "rgb").clamped_rgb
+    if colors.ndim != 2 or colors.shape[1] != 3 or not len(colors):
+        raise ValueError("Palette must contain one or more RGB colors.")
+    return colors
+
+def _floyd_steinberg(image, palette):
+    height, width = image.shape[:2]
+    # Pad by one column either side and one row below, so errors pushed
+    # off the image's edges land somewhere harmless.
+    work = np.zeros((height + 1, width + 2, 3))
+    work[:height, 1:width + 1] = image
+    indices = np.empty((height, width), dtype=np.intp)
+    for t in range(width + 2 * (height - 1)):
+        ys = np.arange(max(0, (t - width + 2) // 2), min(height - 1, t // 2) + 1)
+        xs = t - 2 * ys
+        values = work[ys, xs + 1]
+        chosen = palette.nearest(values)
+        indices[ys, xs] = chosen
+        error = values - palette.colors[chosen]
+        # One direction at a time: within a direction, targets are distinct.
+        work[ys, xs + 2] += error * (7 / 16.0)
+        work[ys + 1, xs] += error * (3 / 16.0)
+        work[ys + 1, xs + 1] += error * (5 / 16.0)
+        work[ys + 1, xs + 2] += error * (1 / 16.0)
+    return indices
+
+def dither(image, palette="websafe", method="floyd-steinberg", output="rgb",
+        matrix_size=4, spread=None):
+    """
+    Reduce an RGB image to a palette of colors.
+
+    :param image: Array of shape (height, width, 3); floats in 0.0-1.0, or
+        integers spanning their dtype's range.
+    :param palette: "websafe", or the colors to use: a list of
+        spectra.Color objects or web-color/hexcode strings, a
+        spectra.ColorArray, or a (k, 3) array of RGB values in 0.0-1.0.
+    :param str method: "nearest", "ordered", or "floyd-steinberg".
+    :param str output: "rgb" for an image of palette colors, with the
+        same shape and dtype as `image`, or "index" for a (height, width)
+        array of indices into the palette (for the web-safe palette, into
+        WEBSAFE_PALETTE).
+    :param int matrix_size: For "ordered", the Bayer matrix size.
+    :param spread: For "ordered", the amplitude of the threshold pattern.
+        Defaults to the median distance between neighboring palette colors.
+    :type spread: float or None
+
+    :rtype: numpy.ndarray
+    """
+    if method not in METHODS:
+        raise ValueError("Unknown dithering method: '{0}'".format(method))
+    if output not in ("rgb", "index"):
+        raise ValueError("Unknown output: '{0}'".format(output))
+    image = np.asarray(image)
+    if image.ndim != 3 or image.shape[2] != 3:
+        raise ValueError("dither expects a (height, width, 3) array.")
+    max_value = None
+    values = image.astype(float)
+    if np.issubdtype(image.dtype, np.integer):
+        max_value = np.iinfo(image.dtype).max
+        values /= max_value
+    palette = _Palette(palette)
+
+    if method == "nearest":
+        indices = palette.nearest(values)
+    elif method == "ordered":
+        if spread is None:
+            spread = palette.spread()
+        matrix = bayer_matrix(matrix_size)
+        threshold = (matrix + 0.5) / matrix.size - 0.5
+        height, width = values.shape[:2]
+        reps = (-(-height // matrix_size), -(-width // matrix_size))
+        offsets = np.tile(threshold, reps)[:height, :width, None]
+        indices = palette.nearest(values + offsets * spread)
+    else:
+        indices = _floyd_steinberg(values, palette)
+
+    if output == "index":
+        return indices
+    result = palette.colors[indices]
+    if max_value is not None:
+        return np.floor(0.5 + result * max_value).astype(image.dtype)
+    return result.astype(image.dtype)
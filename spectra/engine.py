@@ -0,0 +1,273 @@
+"""
+Conversion engines for single spectra.Color objects.
+
+The default "python" engine converts colors with plain `math`, following
+the precomputed conversion paths in spectra.spaces. The "colormath" engine
+delegates to `colormath`, which is only imported when it's actually used.
+Conversions the selected engine doesn't cover fall back to "colormath".
+
+The engine can be chosen per process with set_engine(), or via the
+SPECTRA_ENGINE environment variable.
+"""
+import math
+import os
+from spectra import spaces
+from spectra.spaces import CIE_E, ILLUMINANTS, RGB_ILLUMINANT
+
+def _matmul(matrix, values):
+    x, y, z = values
+    return tuple(m[0] * x + m[1] * y + m[2] * z for m in matrix)
+
+def _rgb_hue(r, g, b, v_min, v_max):
+    if v_max == v_min:
+        return 0.0
+    elif v_max == r:
+        return (60.0 * ((g - b) / (v_max - v_min)) + 360) % 360.0
+    elif v_max == g:
+        return 60.0 * ((b - r) / (v_max - v_min)) + 120
+    else:
+        return 60.0 * ((r - g) / (v_max - v_min)) + 240.0
+
+def _lab_to_lch(values, illum):
+    l, a, b = values
+    c = math.sqrt(a ** 2 + b ** 2)
+    h = math.atan2(b, a)
+    h = (h / math.pi) * 180 if h > 0 else 360 - (math.fabs(h) / math.pi) * 180
+    return (l, c, h), illum
+
+def _lch_to_lab(values, illum):
+    l, c, h = values
+    rad = math.radians(h)
+    return (l, math.cos(rad) * c, math.sin(rad) * c), illum
+
+def _lab_to_xyz(values, illum):
+    l, a, b = values
+    y = (l + 16.0) / 116.0
+    f = (a / 500.0 + y, y, y - b / 200.0)
+    white = ILLUMINANTS[illum]
+    return tuple(w * (v ** 3 if v ** 3 > CIE_E else (v - 16.0 / 116.0) / 7.787)
+        for v, w in zip(f, white)), illum
+
+def _xyz_to_lab(values, illum):
+    t = [ v / w for v, w in zip(values, ILLUMINANTS[illum]) ]
+    fx, fy, fz = [ math.pow(v, 1.0 / 3.0) if v > CIE_E else (7.787 * v) + (16.0 / 116.0)
+        for v in t ]
+    return (116.0 * fy - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)), illum
+
+def _xyz_to_rgb(values, illum):
+    if illum != RGB_ILLUMINANT:
+        values = _matmul(spaces.ADAPTATION_MATRICES[(illum, RGB_ILLUMINANT)], values)
+    linear = [ max(v, 0.0) for v in _matmul(spaces.XYZ_TO_RGB, values) ]
+    return tuple(v * 12.92 if v <= 0.0031308 else 1.055 * math.pow(v, 1 / 2.4) - 0.055
+        for v in linear), RGB_ILLUMINANT
+
+def _rgb_to_xyz(values, illum):
+    linear = [ v / 12.92 if v <= 0.04045 else math.pow((v + 0.055) / 1.055, 2.4)
+        for v in values ]
+    xyz = _matmul(spaces.RGB_TO_XYZ, linear)
+    return tuple(max(v, 0.0) for v in xyz), RGB_ILLUMINANT
+
+def _rgb_to_hsl(values, illum):
+    r, g, b = values
+    v_max = max(values)
+    v_min = min(values)
+    h = _rgb_hue(r, g, b, v_min, v_max)
+    l = 0.5 * (v_max + v_min)
+    if v_max == v_min:
+        s = 0.0
+    elif l <= 0.5:
+        s = (v_max - v_min) / (2.0 * l)
+    else:
+        s = (v_max - v_min) / (2.0 - (2.0 * l))
+    return (h, s, l), illum
+
+def _hsl_component(q, p, c):
+    if c < 0: c += 1.0
+    if c > 1: c -= 1.0
+    if c < (1.0 / 6.0):
+        return p + ((q - p) * 6.0 * c)
+    elif c < 0.5:
+        return q
+    elif c < (2.0 / 3.0):
+        return p + ((q - p) * 6.0 * ((2.0 / 3.0) - c))
+    return p
+
+def _hsl_to_rgb(values, illum):
+    h, s, l = values
+    q = l * (1.0 + s) if l < 0.5 else l + s - (l * s)
+    p = 2.0 * l - q
+    k = h / 360.0
+    return (_hsl_component(q, p, k + (1.0 / 3.0)),
+        _hsl_component(q, p, k),
+        _hsl_component(q, p, k - (1.0 / 3.0))), illum
+
+def _rgb_to_hsv(values, illum):
+    r, g, b = values
+    v_max = max(values)
+    v_min = min(values)
+    h = _rgb_hue(r, g, b, v_min, v_max)
+    s = 0.0 if v_max == 0 else 1.0 - (v_min / v_max)
+    return (h, s, v_max), illum
+
+def _hsv_to_rgb(values, illum):
+    h, s, v = values
+    h_floored = int(math.floor(h))
+    sector = int(h_floored / 60) % 6
+    f = (h / 60.0) - (h_floored // 60)
+    p = v * (1.0 - s)
+    q = v * (1.0 - f * s)
+    t = v * (1.0 - (1.0 - f) * s)
+    return [
+        (v, t, p),
+        (q, v, p),
+        (p, v, t),
+        (p, q, v),
+        (t, p, v),
+        (v, p, q),
+    ][sector], illum
+
+def _rgb_to_cmy(values, illum):
+    return tuple(1.0 - v for v in values), illum
+
+def _cmy_to_rgb(values, illum):
+    return tuple(1.0 - v for v in values), illum
+
+def _cmy_to_cmyk(values, illum):
+    k = min(min(values), 1.0)
+    if k == 1:
+        return (0.0, 0.0, 0.0, k), illum
+    return tuple((v - k) / (1.0 - k) for v in values) + (k,), illum
+
+def _cmyk_to_cmy(values, illum):
+    c, m, y, k = values
+    return tuple(v * (1.0 - k) + k for v in (c, m, y)), illum
+
+EDGES = {
+    ("lab", "lch"): _lab_to_lch,
+    ("lch", "lab"): _lch_to_lab,
+    ("lab", "xyz"): _lab_to_xyz,
+    ("xyz", "lab"): _xyz_to_lab,
+    ("xyz", "rgb"): _xyz_to_rgb,
+    ("rgb", "xyz"): _rgb_to_xyz,
+    ("rgb", "hsl"): _rgb_to_hsl,
+    ("hsl", "rgb"): _hsl_to_rgb,
+    ("rgb", "hsv"): _rgb_to_hsv,
+    ("hsv", "rgb"): _hsv_to_rgb,
+    ("rgb", "cmy"): _rgb_to_cmy,
+    ("cmy", "rgb"): _cmy_to_rgb,
+    ("cmy", "cmyk"): _cmy_to_cmyk,
+    ("cmyk", "cmy"): _cmyk_to_cmy,
+}
+
+class PythonEngine(object):
+    """
+    Converts colors with plain Python math, along precomputed paths.
+    """
+    name = "python"
+
+    def __init__(self):
+        self.paths = dict((key, tuple(EDGES[step] for step in path))
+            for key, path in spaces.PATHS.items())
+
+    def covers(self, from_space, to_space):
+        """
+        Whether this engine can convert between the two color spaces.
+
+        :rtype: bool
+        """
+        return (from_space, to_space) in self.paths
+
+    def convert(self, from_space, values, to_space):
+        """
+        Convert a single color's values to another color space.
+
+        :param str from_space: Name of the source color space.
+        :param tuple values: The color's values.
+        :param str to_space: Name of the target color space.
+
+        :rtype: tuple
+        :returns: The converted values.
+        """
+        values = tuple(float(v) for v in values)
+        illum = spaces.SOURCE_ILLUMINANT
+        for step in self.paths[(from_space, to_space)]:
+            values, illum = step(values, illum)
+        return values
+
+class ColormathEngine(object):
+    """
+    Converts colors via `colormath`'s convert_color.
+    """
+    name = "colormath"
+
+    def covers(self, from_space, to_space):
+        """
+        Whether this engine can convert between the two color spaces.
+
+        :rtype: bool
+        """
+        return True
+
+    def convert(self, from_space, values, to_space):
+        """
+        Convert a single color's values to another color space.
+
+        :param str from_space: Name of the source color space.
+        :param tuple values: The color's values.
+        :param str to_space: Name of the target color space.
+
+        :rtype: tuple
+        :returns: The converted values.
+        """
+        from colormath2.color_conversions import convert_color
+        from spectra.core import COLOR_SPACES
+        color_object = COLOR_SPACES[from_space](*values)
+        return convert_color(color_object, COLOR_SPACES[to_space]).get_value_tuple()
+
+ENGINES = {
+    "python": PythonEngine(),
+    "colormath": ColormathEngine(),
+}
+
+_engine = None
+
+def set_engine(name):
+    """
+    Select the conversion engine used by spectra.Color, for this process.
+
+    :param str name: "python" or "colormath".
+    """
+    global _engine
+    if name not in ENGINES:
+        raise ValueError("Unknown engine: '{0}'".format(name))
+    _engine = ENGINES[name]
+
+def get_engine():
+    """
+    Name the conversion engine used by spectra.Color.
+
+    :rtype: str
+    :returns: "python" or "colormath".
+    """
+    return _engine.name
+
+def convert(from_space, values, to_space):
+    """
+    Convert a single color's values using the selected engine.
+
+    Falls back to the "colormath" engine for conversions the selected
+    engine doesn't cover.
+
+    :param str from_space: Name of the source color space.
+    :param tuple values: The color's values.
+    :param str to_space: Name of the target color space.
+
+    :rtype: tuple
+    :returns: The converted values.
+    """
+    engine = _engine
+    if not engine.covers(from_space, to_space):
+        engine = ENGINES["colormath"]
+    return engine.convert(from_space, values, to_space)
+
+set_engine(os.environ.get("SPECTRA_ENGINE", "python"))
@@ -0,0 +1,90 @@
+"""
+Out-of-core conversion of `.npy` color datasets.
+
+Inputs are memory-mapped and processed `chunk_rows` rows at a time, and
+results are written straight into a memory-mapped `.npy` output, so
+resident memory stays bounded by the chunk size rather than the dataset.
+"""
+import numpy as np
+from spectra import conversions
+
+DEFAULT_CHUNK_ROWS = 1 << 18
+
+def _open_source(src):
+    if hasattr(src, "shape"):
+        return src
+    return np.load(src, mmap_mode="r")
+
+def _open_destination(dst, shape):
+    if hasattr(dst, "shape"):
+        if dst.shape != shape:
+            raise ValueError("dst must have shape {0}".format(shape))
+        return dst
+    return np.lib.format.open_memmap(dst, mode="w+", dtype=float, shape=shape)
+
+def _stream(func, values, out, chunk_rows, progress):
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be at least 1.")
+    total = len(values)
+    for start in range(0, total, chunk_rows):
+        stop = min(start + chunk_rows, total)
+        out[start:stop] = func(np.asarray(values[start:stop], dtype=float))
+        if hasattr(out, "flush"):
+            out.flush()
+        if progress is not None:
+            progress(stop, total)
+    return out
+
+def convert_file(src, dst, from_space, to_space, chunk_rows=DEFAULT_CHUNK_ROWS,
+        progress=None):
+    """
+    Convert an (N, k) `.npy` array of colors to another color space,
+    out of core.
+
+    :param src: Path to a `.npy` file, or an array (e.g. a numpy.memmap).
+    :param dst: Path of the `.npy` file to create, or an (N, k') array
+        (e.g. a numpy.memmap) to write into.
+    :param str from_space: Name of the source color space.
+    :param str to_space: Name of the target color space.
+    :param int chunk_rows: Rows to convert at a time.
+    :param progress: Called as progress(rows_done, total_rows) after each chunk.
+    :type progress: callable or None
+
+    :rtype: numpy.ndarray
+    :returns: The output array (a numpy.memmap, if `dst` is a path).
+    """
+    values = _open_source(src)
+    if values.ndim != 2 or values.shape[1] != conversions.DIMENSIONS[from_space]:
+        msg = "Color space '{0}' expects an (N, {1}) array of values."
+        raise ValueError(msg.format(from_space, conversions.DIMENSIONS[from_space]))
+    out = _open_destination(dst, (len(values), conversions.DIMENSIONS[to_space]))
+    return _stream(lambda chunk: conversions.convert(chunk, from_space, to_space),
+        values, out, chunk_rows, progress)
+
+def map_file(scale, src, dst, chunk_rows=DEFAULT_CHUNK_ROWS, out_of_domain="raise",
+        progress=None):
+    """
+    Map a `.npy` array of numbers through a scale, out of core.
+
+    Equivalent to scale.map(values, output="rgb", out_of_domain=...). With
+    the "raise" policy, rows before the offending chunk will already have
+    been written.
+
+    :param Scale scale: The scale to map through.
+    :param src: Path to a `.npy` file, or an array (e.g. a numpy.memmap).
+    :param dst: Path of the `.npy` file to create, or an (N, 3) array
+        (e.g. a numpy.memmap) to write into.
+    :param int chunk_rows: Numbers to map at a time.
+    :param str out_of_domain: "raise", "clip", or "mask".
+    :param progress: Called as progress(numbers_done, total_numbers) after
+        each chunk.
+    :type progress: callable or None
+
+    :rtype: numpy.ndarray
+    :returns: An (N, 3) array of clamped RGB values (a numpy.memmap, if
+        `dst` is a path).
+    """
+    values = _open_source(src).reshape(-1)
+    out = _open_destination(dst, (len(values), 3))
+    return _stream(lambda chunk: scale.map(chunk, output="rgb",
+        out_of_domain=out_of_domain), values, out, chunk_rows, progress)
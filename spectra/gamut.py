@@ -0,0 +1,186 @@
+"""
+Vectorized sRGB gamut checks and gamut mapping.
+
+Out-of-gamut colors are the rule rather than the exception once colors are
+brightened or saturated in LCH. Clamping each RGB channel (as
+Color.clamped_rgb does) keeps colors displayable, but can shift their hue
+noticeably. The strategies here work on whole arrays at once, with a fixed
+number of vectorized bisection steps rather than per-color loops:
+
+- "clip": clamp each linear-RGB channel to 0.0-1.0.
+- "chroma": keep lightness and hue, and reduce chroma (by bisection in
+  LCH) to the largest value that is in gamut.
+- "minde": as "chroma", but stop reducing chroma as soon as clipping the
+  color would change it by less than a just-noticeable difference, as in
+  the CSS Color Module Level 4 gamut-mapping algorithm. Keeps more
+  chroma than "chroma", at a barely perceptible cost.
+
+CIE colors are mapped in the same sense in which spectra converts them to
+RGB, so the results convert to RGB values within 0.0-1.0 (give or take
+the `tolerance` allowed for rounding).
+"""
+import numpy as np
+from spectra import conversions, difference, spaces
+
+METHODS = ("clip", "chroma", "minde")
+
+_TO_RGB = np.dot(conversions.XYZ_TO_RGB,
+    conversions.ADAPTATION_MATRICES[(spaces.SOURCE_ILLUMINANT, spaces.RGB_ILLUMINANT)])
+_FROM_RGB = np.linalg.inv(_TO_RGB)
+
+def _is_cie(space):
+    return space in ("lab", "lch", "xyz")
+
+def _linear_rgb(lch):
+    """
+    Convert LCH values to linear RGB, without clamping.
+    """
+    xyz = conversions.convert(lch, "lch", "xyz")
+    return conversions._matmul(_TO_RGB, xyz)
+
+def _encode(linear):
+    return np.where(linear <= 0.0031308,
+        linear * 12.92,
+        1.055 * np.power(np.clip(linear, 0.0031308, None), 1 / 2.4) - 0.055)
+
+def _decode(rgb):
+    return np.where(rgb <= 0.04045,
+        rgb / 12.92,
+        np.power((np.clip(rgb, 0.04045, None) + 0.055) / 1.055, 2.4))
+
+def _lch(linear):
+    """
+    Convert linear RGB values to LCH; the exact inverse of _linear_rgb.
+    """
+    xyz = conversions._matmul(_FROM_RGB, linear)
+    lab, _ = conversions._xyz_to_lab(xyz, spaces.SOURCE_ILLUMINANT)
+    return conversions._lab_to_lch(lab, spaces.SOURCE_ILLUMINANT)[0]
+
+def _linear_values(colors):
+    """
+    Get a ColorArray's linear RGB values, without clamping.
+    """
+    if _is_cie(colors.space):
+        return _linear_rgb(conversions.convert(colors.values, colors.space, "lch"))
+    return _decode(conversions.convert(colors.values, colors.space, "rgb"))
+
+def _from_linear(linear, space):
+    """
+    Convert in-gamut linear RGB values to `space`.
+    """
+    if _is_cie(space):
+        return conversions.convert(_lch(linear), "lch", space)
+    return conversions.convert(_encode(linear), "rgb", space)
+
+def _within(linear, tolerance):
+    return np.all((linear >= -tolerance) & (linear <= 1 + tolerance), axis=-1)
+
+def _coerce(colors):
+    from spectra.array import as_color_array
+    from spectra.core import Color
+    return as_color_array(colors), isinstance(colors, Color)
+
+def _result(colors, values, single):
+    from spectra.array import ColorArray
+    mapped = ColorArray(colors.space, values, colors.alpha)
+    return mapped[0] if single else mapped
+
+def in_gamut(colors, tolerance=1e-4):
+    """
+    Check whether colors can be displayed in sRGB without clamping.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+    :param float tolerance: How far outside 0.0-1.0 a linear RGB channel
+        may be, allowing for rounding in the conversion matrices.
+
+    :rtype: bool or numpy.ndarray
+    :returns: Whether each color is in gamut.
+    """
+    colors, single = _coerce(colors)
+    mask = _within(_linear_values(colors), tolerance)
+    return bool(mask[0]) if single else mask
+
+def _map_chroma(lch, iterations, tolerance):
+    lo = np.zeros(len(lch))
+    hi = lch[:, 1].copy()
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        candidate = np.column_stack((lch[:, 0], mid, lch[:, 2]))
+        inside = _within(_linear_rgb(candidate), tolerance)
+        lo = np.where(inside, mid, lo)
+        hi = np.where(inside, hi, mid)
+    return np.column_stack((lch[:, 0], lo, lch[:, 2]))
+
+def _map_minde(lch, iterations, tolerance, jnd, epsilon):
+    def clipped_difference(candidate):
+        clipped = np.clip(_linear_rgb(candidate), 0.0, 1.0)
+        lab = conversions.convert(candidate, "lch", "lab")
+        clipped_lab = conversions.convert(_lch(clipped), "lch", "lab")
+        return clipped, difference.delta_e_cie2000(lab, clipped_lab)
+
+    result, error = clipped_difference(lch)
+    done = error < jnd
+    lo = np.zeros(len(lch))
+    hi = lch[:, 1].copy()
+    lo_inside = np.ones(len(lch), dtype=bool)
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        candidate = np.column_stack((lch[:, 0], mid, lch[:, 2]))
+        clipped, error = clipped_difference(candidate)
+        inside = lo_inside & _within(_linear_rgb(candidate), tolerance)
+        close = ~inside & (error < jnd)
+        finished = ~done & close & (jnd - error < epsilon)
+        result[finished] = clipped[finished]
+        done |= finished
+        lo_inside &= ~(close & ~done)
+        lo = np.where(~done & (inside | close), mid, lo)
+        hi = np.where(~done & ~inside & ~close, mid, hi)
+    final = np.column_stack((lch[:, 0], lo, lch[:, 2]))
+    result[~done] = np.clip(_linear_rgb(final[~done]), 0.0, 1.0)
+    return result
+
+def gamut_map(colors, method="chroma", iterations=24, tolerance=1e-4, jnd=2.0):
+    """
+    Bring colors into the sRGB gamut.
+
+    Colors already in gamut (within `tolerance`) are returned unchanged.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+    :param str method: "clip", "chroma", or "minde".
+    :param int iterations: Bisection steps, for "chroma" and "minde".
+    :param float tolerance: See in_gamut.
+    :param float jnd: For "minde", the largest CIEDE2000 difference that
+        clipping may introduce.
+
+    :rtype: Color or ColorArray
+    :returns: A new spectra.Color, for a single color; otherwise a new
+        spectra.ColorArray. Either is in the colors' own color space (for
+        lists, the first color's).
+    """
+    if method not in METHODS:
+        raise ValueError("Unknown gamut-mapping method: '{0}'".format(method))
+    colors, single = _coerce(colors)
+    linear = _linear_values(colors)
+    outside = ~_within(linear, tolerance)
+    linear = linear[outside]
+    values = colors.values.copy()
+    if method == "clip" or not len(linear):
+        values[outside] = _from_linear(np.clip(linear, 0.0, 1.0), colors.space)
+        return _result(colors, values, single)
+
+    lch = _lch(linear)
+    # Lightness outside 0-100 can't be fixed by reducing chroma.
+    lch[:, 0] = np.clip(lch[:, 0], 0.0, 100.0)
+    if method == "chroma":
+        lch = _map_chroma(lch, iterations, tolerance)
+        if _is_cie(colors.space):
+            # Skip the trip through RGB, so hues stay exactly as they were.
+            values[outside] = conversions.convert(lch, "lch", colors.space)
+            return _result(colors, values, single)
+        linear = _linear_rgb(lch)
+    else:
+        linear = _map_minde(lch, iterations, tolerance, jnd, jnd / 200.0)
+    values[outside] = _from_linear(np.clip(linear, 0.0, 1.0), colors.space)
+    return _result(colors, values, single)
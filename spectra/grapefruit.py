@@ -1780,7 +1780,27 @@ class Color:
     [(0.75, 0.25, 0.0, 0.75), (0.5, 0.5, 0.0, 0.5), (0.25, 0.75, 0.0, 0.25)]
 
     '''
-    gradient = []
+    return list(self.IterGradient(target, steps))
+
+  def IterGradient(self, target, steps=100):
+    '''Generate the gradient colors between this and the other color, one at a time.
+
+    Parameters:
+      :target:
+        The grapefruit.Color at the other end of the gradient.
+      :steps:
+        The number of gradients steps to create.
+
+
+    Returns:
+      An iterator of grapefruit.Color instances.
+
+    >>> c1 = Color.NewFromRgb(1.0, 0.0, 0.0, alpha=1)
+    >>> c2 = Color.NewFromRgb(0.0, 1.0, 0.0, alpha=0)
+    >>> next(c1.IterGradient(c2, 3))
+    (0.75, 0.25, 0.0, 0.75)
+
+    '''
     rgba1 = self.__rgb + (self.__a,)
     rgba2 = target.__rgb + (target.__a,)
 
@@ -1792,9 +1812,7 @@ class Color:
       b = (rgba1[2]*(1-d)) + (rgba2[2]*d)
       a = (rgba1[3]*(1-d)) + (rgba2[3]*d)
 
-      gradient.append(Color((r, g, b), 'rgb', a, self.__wref))
-
-    return gradient
+      yield Color((r, g, b), 'rgb', a, self.__wref)
 
   def ComplementaryColor(self, mode='ryb'):
     '''Create a new instance which is the complementary color of this one.
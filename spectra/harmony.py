@@ -0,0 +1,167 @@
+"""
+Vectorized color-harmony schemes.
+
+These follow grapefruit's ComplementaryColor, TriadicScheme,
+TetradicScheme, AnalogousScheme, and MonochromeScheme, but work on many
+base colors at once. Hues are rotated in HSL, on either the RGB color
+wheel or (by default) Itten's RYB wheel; the wheel lookups are done for
+whole arrays with np.interp, over grapefruit's own tables.
+"""
+import numpy as np
+from spectra import conversions
+from spectra.grapefruit import _RgbWheel, _RybWheel
+
+_WHEEL_STEPS = np.arange(0, 361, 15, dtype=float)
+_RYB_WHEEL = np.array(_RybWheel, dtype=float)
+_RGB_WHEEL = np.array(_RgbWheel, dtype=float)
+
+MODES = ("ryb", "rgb")
+
+def rgb_to_ryb(hues):
+    """
+    Map hues on the RGB color wheel to Itten's RYB wheel.
+
+    :param hues: Array-like of hues, 0-360.
+
+    :rtype: numpy.ndarray
+    """
+    return np.interp(hues, _WHEEL_STEPS, _RYB_WHEEL)
+
+def ryb_to_rgb(hues):
+    """
+    Map hues on Itten's RYB color wheel to the RGB wheel.
+
+    :param hues: Array-like of hues, 0-360.
+
+    :rtype: numpy.ndarray
+    """
+    return np.interp(hues, _WHEEL_STEPS, _RGB_WHEEL)
+
+def _prepare(colors, mode):
+    """
+    Get colors as a ColorArray, their HSL values, and their hues on the
+    chosen wheel.
+    """
+    if mode not in MODES:
+        raise ValueError("Unknown color-wheel mode: '{0}'".format(mode))
+    from spectra.array import as_color_array
+    colors = as_color_array(colors)
+    hsl = conversions.convert(colors.values, colors.space, "hsl")
+    hues = hsl[:, 0]
+    if mode == "ryb":
+        hues = rgb_to_ryb(hues)
+    return colors, hsl, hues
+
+def _rotated(colors, hsl, hues, mode):
+    """
+    Create colors like `hsl`, but with the given wheel hues.
+    """
+    hues = hues % 360
+    if mode == "ryb":
+        hues = ryb_to_rgb(hues)
+    values = np.column_stack((hues, hsl[:, 1], hsl[:, 2]))
+    return colors.__class__("hsl", values, colors.alpha).to(colors.space)
+
+def _unwrap(arrays, original):
+    from spectra.core import Color
+    if isinstance(original, Color):
+        return tuple(arr[0] for arr in arrays)
+    return tuple(arrays)
+
+def complementary(colors, mode="ryb"):
+    """
+    Find the complementary color of each color.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+    :param str mode: Color wheel to use: "ryb" or "rgb".
+
+    :rtype: Color or ColorArray
+    :returns: The complementary colors, in the colors' color space (for
+        lists, the first color's).
+    """
+    arr, hsl, hues = _prepare(colors, mode)
+    return _unwrap([ _rotated(arr, hsl, hues + 180, mode) ], colors)[0]
+
+def triadic(colors, angle=120, mode="ryb"):
+    """
+    Find the two colors forming a triad (or, for angles under 120, a split
+    complementary) with each color.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+    :param float angle: The angle between the new colors' hues.
+    :param str mode: Color wheel to use: "ryb" or "rgb".
+
+    :rtype: tuple
+    :returns: Two spectra.Color objects, for a single color; otherwise two
+        spectra.ColorArray objects, with one row per base color.
+    """
+    arr, hsl, hues = _prepare(colors, mode)
+    half = min(angle, 120) / 2.0
+    return _unwrap([ _rotated(arr, hsl, hues + 180 - half, mode),
+        _rotated(arr, hsl, hues + 180 + half, mode) ], colors)
+
+def tetradic(colors, angle=30, mode="ryb"):
+    """
+    Find the three colors forming a tetrad with each color.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+    :param float angle: The angle to subtract from the adjacent colors'
+        hues (-90 -> 90). An angle of 0 makes a square tetrad.
+    :param str mode: Color wheel to use: "ryb" or "rgb".
+
+    :rtype: tuple
+    :returns: Three spectra.Color objects, for a single color; otherwise
+        three spectra.ColorArray objects, with one row per base color.
+    """
+    arr, hsl, hues = _prepare(colors, mode)
+    return _unwrap([ _rotated(arr, hsl, hues + 90 - angle, mode),
+        _rotated(arr, hsl, hues + 180, mode),
+        _rotated(arr, hsl, hues + 270 - angle, mode) ], colors)
+
+def analogous(colors, angle=30, mode="ryb"):
+    """
+    Find the two colors analogous to each color.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+    :param float angle: The angle between the new colors' hues and the
+        base color's.
+    :param str mode: Color wheel to use: "ryb" or "rgb".
+
+    :rtype: tuple
+    :returns: Two spectra.Color objects, for a single color; otherwise two
+        spectra.ColorArray objects, with one row per base color.
+    """
+    arr, hsl, hues = _prepare(colors, mode)
+    return _unwrap([ _rotated(arr, hsl, hues + 360 - angle, mode),
+        _rotated(arr, hsl, hues + 360 + angle, mode) ], colors)
+
+def _wrap(x, minimum, threshold, plus):
+    return np.where(x - minimum < threshold, x + plus, x - minimum)
+
+def monochrome(colors):
+    """
+    Find four colors in the same hue as each color, with varying
+    saturation and lightness.
+
+    :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+        spectra.Color objects.
+
+    :rtype: tuple
+    :returns: Four spectra.Color objects, for a single color; otherwise four
+        spectra.ColorArray objects, with one row per base color.
+    """
+    arr, hsl, _ = _prepare(colors, "rgb")
+    h, s, l = hsl[:, 0], hsl[:, 1], hsl[:, 2]
+    s1 = _wrap(s, 0.3, 0.1, 0.3)
+    variants = [
+        (s1, _wrap(l, 0.5, 0.2, 0.3)),
+        (s, _wrap(l, 0.2, 0.2, 0.6)),
+        (s1, np.maximum(0.2, l + (1 - l) * 0.2)),
+        (s, _wrap(l, 0.5, 0.2, 0.3)),
+    ]
+    return _unwrap([ arr.__class__("hsl", np.column_stack((h, vs, vl)), arr.alpha)
+        .to(arr.space) for vs, vl in variants ], colors)
@@ -0,0 +1,107 @@
+"""
+Nearest-named-color lookups.
+
+The named colors (from grapefruit's NAMED_COLOR table) are indexed in a
+KD-tree in Lab space, built on first use. Queries are answered for whole
+batches at once: each tree node is visited once per batch, with NumPy
+handling all of the queries that reach it.
+"""
+import numpy as np
+from spectra import conversions
+
+class _KDTree(object):
+    """
+    A static KD-tree over a small set of points.
+    """
+    def __init__(self, points):
+        self.points = np.asarray(points, dtype=float)
+        self.dimensions = self.points.shape[1]
+        self.root = self._build(np.arange(len(self.points)), 0)
+
+    def _build(self, indices, depth):
+        if not len(indices): return None
+        axis = depth % self.dimensions
+        order = indices[np.argsort(self.points[indices, axis], kind="stable")]
+        mid = len(order) // 2
+        return (order[mid], axis,
+            self._build(order[:mid], depth + 1),
+            self._build(order[mid + 1:], depth + 1))
+
+    def query(self, queries):
+        """
+        Find the nearest point to each query.
+
+        :param queries: Array-like of shape (N, k).
+
+        :rtype: tuple
+        :returns: The indices of the nearest points, and their distances.
+        """
+        queries = np.asarray(queries, dtype=float).reshape(-1, self.dimensions)
+        best_dist = np.full(len(queries), np.inf)
+        best_index = np.zeros(len(queries), dtype=np.intp)
+        self._search(self.root, queries, np.arange(len(queries)), best_dist, best_index)
+        return best_index, np.sqrt(best_dist)
+
+    def _search(self, node, queries, active, best_dist, best_index):
+        if node is None or not len(active): return
+        index, axis, left, right = node
+        point = self.points[index]
+        dist = np.sum((queries[active] - point) ** 2, axis=1)
+        better = dist < best_dist[active]
+        best_dist[active[better]] = dist[better]
+        best_index[active[better]] = index
+
+        diff = queries[active, axis] - point[axis]
+        near_left = diff < 0
+        self._search(left, queries, active[near_left], best_dist, best_index)
+        self._search(right, queries, active[~near_left], best_dist, best_index)
+
+        # Only cross the splitting plane where it's closer than the best so far.
+        crosses = diff ** 2 < best_dist[active]
+        self._search(right, queries, active[near_left & crosses], best_dist, best_index)
+        self._search(left, queries, active[~near_left & crosses], best_dist, best_index)
+
+class _NameIndex(object):
+    """
+    Indexes named colors by their Lab values.
+    """
+    def __init__(self, named_colors):
+        names = []
+        hexcodes = set()
+        # Where several names share a color, keep the alphabetically first.
+        for name in sorted(named_colors):
+            if named_colors[name] in hexcodes: continue
+            hexcodes.add(named_colors[name])
+            names.append(name)
+        from spectra.core import _parse_html
+        rgb = [ _parse_html(named_colors[name]) for name in names ]
+        self.names = names
+        self.tree = _KDTree(conversions.convert(rgb, "rgb", "lab"))
+
+    def nearest(self, lab):
+        indices, _ = self.tree.query(lab)
+        return [ self.names[i] for i in indices.tolist() ]
+
+_index = None
+
+def _get_index():
+    global _index
+    if _index is None:
+        from spectra.grapefruit import Color as GC
+        _index = _NameIndex(GC.NAMED_COLOR)
+    return _index
+
+def nearest_names(colors):
+    """
+    Find the closest web-color name for each of many colors.
+
+    Closeness is measured by Euclidean distance in Lab (i.e., CIE1976
+    Delta E).
+
+    :param colors: A spectra.ColorArray, or a list of spectra.Color objects.
+
+    :rtype: list
+    :returns: A list of web-color names.
+    """
+    from spectra.array import as_color_array
+    return _get_index().nearest(as_color_array(colors, "lab").values)
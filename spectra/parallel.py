@@ -0,0 +1,136 @@
+"""
+Multi-core bulk conversion and scale mapping.
+
+Inputs and outputs live in `multiprocessing.shared_memory` blocks, so
+worker processes read and write them directly and only block names and
+row ranges are pickled. Each worker runs the same vectorized code as the
+serial path, so results are identical.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from spectra import conversions
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before Python 3.13, attaching registers the block with the resource
+    # tracker, which would then warn about (or unlink) a block the parent
+    # still owns.
+    from multiprocessing import resource_tracker
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+def _convert_chunk(src, dst, start, stop, from_space, to_space):
+    src_shm, dst_shm = _attach(src[0]), _attach(dst[0])
+    try:
+        values = np.ndarray(src[1], dtype=float, buffer=src_shm.buf)
+        out = np.ndarray(dst[1], dtype=float, buffer=dst_shm.buf)
+        out[start:stop] = conversions.convert(values[start:stop], from_space, to_space)
+        del values, out
+    finally:
+        src_shm.close()
+        dst_shm.close()
+
+def _map_chunk(src, dst, start, stop, scale, out_of_domain):
+    src_shm, dst_shm = _attach(src[0]), _attach(dst[0])
+    try:
+        numbers = np.ndarray(src[1], dtype=float, buffer=src_shm.buf)
+        out = np.ndarray(dst[1], dtype=float, buffer=dst_shm.buf)
+        out[start:stop] = scale.map(numbers[start:stop], output="rgb",
+            out_of_domain=out_of_domain)
+        del numbers, out
+    finally:
+        src_shm.close()
+        dst_shm.close()
+
+def _run(func, values, out_shape, args, workers, chunk_size):
+    """
+    Run `func` over row chunks of `values` in a process pool, and return
+    a private copy of the shared output.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    workers = workers or os.cpu_count() or 1
+    n = len(values)
+    src = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+    try:
+        dst = shared_memory.SharedMemory(create=True,
+            size=max(int(np.prod(out_shape)) * 8, 1))
+        try:
+            np.ndarray(values.shape, dtype=float, buffer=src.buf)[:] = values
+            src_ref = (src.name, values.shape)
+            dst_ref = (dst.name, out_shape)
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [ pool.submit(func, src_ref, dst_ref,
+                    start, min(start + chunk_size, n), *args)
+                    for start in range(0, n, chunk_size) ]
+                for future in futures:
+                    future.result()
+            return np.ndarray(out_shape, dtype=float, buffer=dst.buf).copy()
+        finally:
+            dst.close()
+            dst.unlink()
+    finally:
+        src.close()
+        src.unlink()
+
+def convert(values, from_space, to_space, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Convert an (N, k) array of colors to another color space, in parallel.
+
+    Arrays of no more than `chunk_size` rows, or `workers=1`, are converted
+    serially in this process.
+
+    :param values: Array-like of shape (N, k), or a spectra.ColorArray.
+    :param str from_space: Name of the source color space.
+    :param str to_space: Name of the target color space.
+    :param workers: Number of worker processes. Defaults to the CPU count.
+    :type workers: int or None
+    :param int chunk_size: Rows per task.
+
+    :rtype: numpy.ndarray
+    :returns: An (N, k') array in `to_space`.
+    """
+    if hasattr(values, "space"):
+        values = values.values
+    values = np.ascontiguousarray(values, dtype=float)
+    if values.ndim != 2 or values.shape[1] != conversions.DIMENSIONS[from_space]:
+        msg = "Color space '{0}' expects an (N, {1}) array of values."
+        raise ValueError(msg.format(from_space, conversions.DIMENSIONS[from_space]))
+    if workers == 1 or len(values) <= chunk_size:
+        return conversions.convert(values, from_space, to_space)
+    out_shape = (len(values), conversions.DIMENSIONS[to_space])
+    return _run(_convert_chunk, values, out_shape,
+        (from_space, to_space), workers, chunk_size)
+
+def map_scale(scale, values, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+        out_of_domain="raise"):
+    """
+    Map an array of numbers through a scale, in parallel.
+
+    Equivalent to scale.map(values, output="rgb", out_of_domain=...).
+
+    :param Scale scale: The scale to map through.
+    :param values: 1-D array-like of numbers.
+    :param workers: Number of worker processes. Defaults to the CPU count.
+    :type workers: int or None
+    :param int chunk_size: Numbers per task.
+    :param str out_of_domain: "raise", "clip", or "mask".
+
+    :rtype: numpy.ndarray
+    :returns: An (N, 3) array of clamped RGB values.
+    """
+    numbers = np.ascontiguousarray(values, dtype=float).ravel()
+    if workers == 1 or len(numbers) <= chunk_size:
+        return scale.map(numbers, output="rgb", out_of_domain=out_of_domain)
+    return _run(_map_chunk, numbers, (len(numbers), 3),
+        (scale, out_of_domain), workers, chunk_size)
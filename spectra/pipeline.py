@@ -0,0 +1,297 @@
+"""
+Fused color-operation pipelines.
+
+A pipeline records a chain of operations, e.g.
+
+    spectra.ops().brighten(5).saturate(10).to("hsl")
+
+and applies it to a spectra.Color or to many colors at once, with the
+same results as the equivalent chain of Color methods but without the
+intermediate Color objects.
+
+The chain is planned once per starting color space. Conversions that
+can't change the result are skipped: adjacent adjustments of CIE colors
+(lab, lch, xyz) are merged into a single LCH adjustment, and RGB-based
+colors (rgb, hsl, hsv, cmy, cmyk) only return to RGB, not to their own
+space, between adjustments. The return trip itself is kept, since LCH
+values derived from RGB are not relative to the same illuminant as the
+LCH values that convert back to it.
+
+A skipped round trip out of LCH and back would also have changed some
+LCH values: negative chroma (c, h) becomes (-c, h + 180), and zero
+chroma resets the hue to 0 (or, via XYZ, to whatever rounding leaves).
+Where that could matter, the plan keeps the round trip, through LAB or
+XYZ as the chain would have (a "normalize" step). Likewise, colors
+still in their own RGB-based space (e.g. CMYK colors, whose K channel
+isn't recomputed until they are converted back from RGB) are converted
+for real, rather than only on paper.
+"""
+import numpy as np
+from spectra import conversions, engine, spaces
+from spectra.core import Color
+
+class Pipeline(object):
+    """
+    Represents a planned chain of color operations.
+
+    Pipelines are immutable; each method returns a new pipeline.
+    """
+    def __init__(self, steps=()):
+        """
+        :param tuple steps: ("adjust", (luminance, chroma)) and
+            ("to", space) steps. Use spectra.ops() instead.
+        """
+        self.steps = tuple(steps)
+        self._plans = {}
+        self._per_color = any(np.ndim(amount) for kind, arg in self.steps
+            if kind == "adjust" for amount in arg)
+
+    def _then(self, kind, arg):
+        return self.__class__(self.steps + ((kind, arg),))
+
+    def _adjust(self, luminance, chroma):
+        return self._then("adjust", (_amount(luminance), _amount(chroma)))
+
+    def brighten(self, amount=10):
+        """
+        Add a step increasing luminance by `amount`. See Color.brighten.
+
+        :param amount: A number, or (for batches) one number per color.
+
+        :rtype: Pipeline
+        :returns: A new spectra.Pipeline
+        """
+        return self._adjust(amount, 0.0)
+
+    def darken(self, amount=10):
+        """
+        Add a step decreasing luminance by `amount`. See Color.darken.
+
+        :param amount: A number, or (for batches) one number per color.
+
+        :rtype: Pipeline
+        :returns: A new spectra.Pipeline
+        """
+        return self._adjust(-_amount(amount), 0.0)
+
+    def saturate(self, amount=10):
+        """
+        Add a step increasing chroma by `amount`. See Color.saturate.
+
+        :param amount: A number, or (for batches) one number per color.
+
+        :rtype: Pipeline
+        :returns: A new spectra.Pipeline
+        """
+        return self._adjust(0.0, amount)
+
+    def desaturate(self, amount=10):
+        """
+        Add a step decreasing chroma by `amount`. See Color.desaturate.
+
+        :param amount: A number, or (for batches) one number per color.
+
+        :rtype: Pipeline
+        :returns: A new spectra.Pipeline
+        """
+        return self._adjust(0.0, -_amount(amount))
+
+    def to(self, space):
+        """
+        Add a step converting to another color space.
+
+        :param str space: Name of the color space.
+
+        :rtype: Pipeline
+        :returns: A new spectra.Pipeline
+        """
+        if space not in conversions.DIMENSIONS:
+            raise ValueError("Unknown color space: '{0}'".format(space))
+        return self._then("to", space)
+
+    def plan(self, space):
+        """
+        Plan the work needed to apply this pipeline to colors in `space`.
+
+        :param str space: Name of the starting color space.
+
+        :rtype: list
+        :returns: ("convert", from_space, to_space), ("adjust",
+            (luminance, chroma)), and ("normalize", via_space) operations,
+            in order.
+        """
+        return self._plan(space)[0]
+
+    def _plan(self, space):
+        """
+        Plan (once per starting space) this pipeline's operations, and
+        the color space they end in.
+        """
+        if space in self._plans:
+            return self._plans[space]
+        ops = []
+        # `left`: whether the Color chain has left LCH (and so would
+        # normalize on the way back) since the plan last did.
+        # `normalized`: whether the current LCH values are known to
+        # survive that round trip: non-negative chroma, hues within 0-360,
+        # and hue 0 for zero chroma.
+        # `via`: the farthest space ("lab" or "xyz") the chain went to.
+        state = { "current": space, "left": False, "normalized": False, "via": "lab" }
+        def convert(target):
+            source = state["current"]
+            if target == source: return
+            # Fuse a -> b -> c into a -> c, if b is on the way anyway.
+            if ops and ops[-1][0] == "convert" and _fusable(ops[-1][1], source, target):
+                source = ops.pop()[1]
+            ops.append(("convert", source, target))
+            state.update(current=target, left=False, normalized=(target == "lch"))
+        def normalize():
+            # Rounding in XYZ can move near-zero chroma anywhere, so a
+            # trip through XYZ is always kept.
+            if state["left"] and (state["via"] == "xyz" or not state["normalized"]):
+                ops.append(("normalize", state["via"]))
+                state["normalized"] = True
+            state.update(left=False, via="lab")
+        def leave(target):
+            state["left"] = True
+            if target == "xyz":
+                state["via"] = "xyz"
+        nominal = space
+        for kind, arg in self.steps:
+            if kind == "adjust":
+                convert("lch")
+                normalize()
+                if ops and ops[-1][0] == "adjust":
+                    previous = ops.pop()[1]
+                    arg = (previous[0] + arg[0], previous[1] + arg[1])
+                ops.append(("adjust", arg))
+                # Only adding chroma keeps normalized values normalized.
+                state["normalized"] &= bool(np.ndim(arg[1]) == 0 and arg[1] >= 0)
+                if _family(nominal) == "rgb":
+                    convert("rgb")
+                elif nominal != "lch":
+                    leave(nominal)
+            else:
+                nominal = arg
+                if arg == "xyz" and state["current"] not in ("lch", "xyz"):
+                    # XYZ values derived from RGB are relative to its
+                    # illuminant, and those from LAB are rounded, so the
+                    # chain's XYZ colors must be real.
+                    convert("xyz")
+                elif _family(arg) != _family(state["current"]):
+                    convert(_family(arg))
+                elif _family(arg) == "rgb" and state["current"] != "rgb":
+                    # E.g. CMYK -> RGB -> CMYK can change a CMYK color;
+                    # only RGB -> X -> RGB is sure not to.
+                    convert(arg)
+                elif arg != "lch" and state["current"] == "lch":
+                    leave(arg)
+        if nominal == "lch":
+            normalize()
+        convert(nominal)
+        self._plans[space] = (ops, nominal)
+        return self._plans[space]
+
+    def _run(self, values, space, convert, adjust, normalize):
+        """
+        Apply the plan for `space` to `values`.
+
+        Returns the new values, and their color space.
+        """
+        ops, target = self._plan(space)
+        for op in ops:
+            if op[0] == "adjust":
+                values = adjust(values, op[1])
+            elif op[0] == "normalize":
+                values = normalize(values, op[1])
+            else:
+                values = convert(values, op[1], op[2])
+        return values, target
+
+    def apply(self, colors):
+        """
+        Apply this pipeline to one or many colors.
+
+        :param colors: A spectra.Color, a spectra.ColorArray, or a list of
+            spectra.Color objects.
+
+        :rtype: Color or ColorArray
+        :returns: A new spectra.Color, for a single color; otherwise a new
+            spectra.ColorArray (for lists, starting in the first color's
+            color space).
+        """
+        if isinstance(colors, Color):
+            if self._per_color:
+                raise ValueError("Per-color amounts need a batch of colors.")
+            values, space = self._run(colors.values, colors.space,
+                _convert_one, _adjust_one, _normalize_one)
+            return Color(space, *values, alpha=colors.alpha)
+        from spectra.array import ColorArray, as_color_array
+        colors = as_color_array(colors)
+        values, space = self._run(colors.values, colors.space,
+            conversions.convert, _adjust_many, _normalize_many)
+        return ColorArray(space, values, colors.alpha)
+
+    __call__ = apply
+
+    def __repr__(self):
+        return "Pipeline({0!r})".format(list(self.steps))
+
+def _family(space):
+    """
+    Name the space that `space` reaches LCH through: "rgb" or "lch".
+    """
+    if space == "rgb" or any("rgb" in edge for edge in spaces.PATHS[(space, "lch")]):
+        return "rgb"
+    return "lch"
+
+def _fusable(start, space, target):
+    """
+    Whether converting from `start` to `target` passes through `space`,
+    with the same result as stopping there.
+
+    CIE values derived from RGB are relative to its illuminant, but are
+    taken to be relative to spectra's once they are a Color's values; so
+    only LAB and LCH values are interchangeable on the way from RGB.
+    """
+    path = spaces.PATHS[(start, target)]
+    if not any(space in edge for edge in path):
+        return False
+    if _family(start) == "rgb" and space in ("lab", "lch", "xyz"):
+        return space != "xyz" and target in ("lab", "lch")
+    return True
+
+def _amount(amount):
+    if np.ndim(amount):
+        return np.asarray(amount, dtype=float)
+    return float(amount)
+
+def _convert_one(values, from_space, to_space):
+    return engine.convert(from_space, values, to_space)
+
+def _adjust_one(values, deltas):
+    l, c, h = values
+    return (l + deltas[0], c + deltas[1], h)
+
+def _adjust_many(values, deltas):
+    values = np.array(values)
+    values[:, 0] += deltas[0]
+    values[:, 1] += deltas[1]
+    return values
+
+def _normalize_one(values, via):
+    return _convert_one(_convert_one(values, "lch", via), via, "lch")
+
+def _normalize_many(values, via):
+    return conversions.convert(conversions.convert(values, "lch", via), via, "lch")
+
+def ops():
+    """
+    Start a new, empty color-operation pipeline.
+
+    E.g.: spectra.ops().brighten(5).saturate(10).to("hsl")
+
+    :rtype: Pipeline
+    :returns: A new spectra.Pipeline
+    """
+    return Pipeline()
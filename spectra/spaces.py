@@ -0,0 +1,95 @@
+"""
+Color-space definitions shared by spectra's conversion engines.
+
+The constants match `colormath`'s, so that every engine produces the same
+results as converting via `colormath` directly.
+"""
+
+DIMENSIONS = {
+    "lab": 3,
+    "rgb": 3,
+    "lch": 3,
+    "xyz": 3,
+    "hsl": 3,
+    "hsv": 3,
+    "cmy": 3,
+    "cmyk": 4
+}
+
+# Each pair is a direct conversion; longer conversions chain these.
+EDGES = (
+    ("lab", "lch"), ("lch", "lab"),
+    ("lab", "xyz"), ("xyz", "lab"),
+    ("xyz", "rgb"), ("rgb", "xyz"),
+    ("rgb", "hsl"), ("hsl", "rgb"),
+    ("rgb", "hsv"), ("hsv", "rgb"),
+    ("rgb", "cmy"), ("cmy", "rgb"),
+    ("cmy", "cmyk"), ("cmyk", "cmy"),
+)
+
+CIE_E = 216.0 / 24389.0
+
+ILLUMINANTS = {
+    "d50": (0.96422, 1.00000, 0.82521),
+    "d65": (0.95047, 1.00000, 1.08883),
+}
+
+# CIE colors created directly are relative to D50, per `colormath`;
+# XYZ values derived from sRGB are relative to its native D65.
+SOURCE_ILLUMINANT = "d50"
+RGB_ILLUMINANT = "d65"
+
+RGB_TO_XYZ = (
+    (0.412424, 0.357579, 0.180464),
+    (0.212656, 0.715158, 0.0721856),
+    (0.0193324, 0.119193, 0.950444),
+)
+
+XYZ_TO_RGB = (
+    (3.24071, -1.53726, -0.498571),
+    (-0.969258, 1.87599, 0.0415557),
+    (0.0556352, -0.203996, 1.05707),
+)
+
+# Bradford chromatic adaptation, as computed by `colormath`.
+ADAPTATION_MATRICES = {
+    ("d50", "d65"): (
+        (0.955576615033105, -0.023039344716078856, 0.06316363224980096),
+        (-0.0282895442435544, 1.0099416173711135, 0.021007654996190187),
+        (0.0122981657172073, -0.020483025232449457, 1.329909826449757),
+    ),
+    ("d65", "d50"): (
+        (1.047811243660631, 0.02288660248169289, -0.05012697596852903),
+        (0.029542398290575422, 0.9904844034904388, -0.01704909562896167),
+        (-0.009234489723309446, 0.015043616793498712, 0.7521316354746059),
+    ),
+}
+
+def find_path(start, target):
+    """
+    Find the shortest chain of EDGES from one color space to another.
+
+    :param str start: Name of the source color space.
+    :param str target: Name of the target color space.
+
+    :rtype: tuple
+    :returns: A tuple of (from, to) pairs, empty if start == target.
+    """
+    previous = { start: None }
+    queue = [ start ]
+    while queue:
+        node = queue.pop(0)
+        if node == target: break
+        for a, b in EDGES:
+            if a == node and b not in previous:
+                previous[b] = a
+                queue.append(b)
+    steps = []
+    node = target
+    while previous[node] is not None:
+        steps.insert(0, (previous[node], node))
+        node = previous[node]
+    return tuple(steps)
+
+PATHS = dict(((a, b), find_path(a, b))
+    for a in DIMENSIONS for b in DIMENSIONS)
@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+import spectra
+
+SAMPLES = {
+    "rgb": [ (0.2, 0.5, 0.7), (1.0, 0.0, 0.0), (0.0, 0.0, 0.0), (1.2, -0.1, 0.4) ],
+    "lab": [ (50, -20, 30), (90, 10, -60), (0, 0, 0), (30, 80, 10) ],
+    "lch": [ (60, 40, 300), (20, 5, 10), (75, 0, 0), (50, 90, 180) ],
+    "xyz": [ (0.2, 0.3, 0.4), (0.9, 1.0, 0.8), (0.0, 0.0, 0.0), (0.05, 0.02, 0.3) ],
+    "hsl": [ (200, 0.5, 0.4), (10, 1.0, 0.5), (359, 0.2, 0.9), (120, 0.0, 0.3) ],
+    "hsv": [ (200, 0.5, 0.4), (10, 1.0, 0.5), (359.5, 0.2, 0.9), (300, 0.7, 1.0) ],
+    "cmy": [ (0.1, 0.5, 0.9), (1, 1, 1), (0, 0, 0), (0.3, 0.3, 0.2) ],
+    "cmyk": [ (0.1, 0.5, 0.9, 0.2), (0, 0, 0, 1), (0, 0, 0, 0), (0.4, 0.1, 0.0, 0.3) ],
+}
+
+
+@pytest.mark.parametrize("source", sorted(SAMPLES))
+@pytest.mark.parametrize("target", sorted(SAMPLES))
+def test_matches_color(source, target):
+    arr = spectra.ColorArray(source, SAMPLES[source]).to(target)
+    expected = [ spectra.Color(source, *v).to(target).values
+        for v in SAMPLES[source] ]
+    assert arr.space == target
+    assert np.allclose(arr.values, expected)
+
+
+def test_hexcodes():
+    colors = [ spectra.html(h) for h in [ "#ff8000", "papayawhip", "#123456" ] ]
+    arr = spectra.ColorArray.from_colors(colors)
+    assert arr.hexcodes == [ c.hexcode for c in colors ]
+    lab = arr.to("lab")
+    expected = [ c.to("lab") for c in colors ]
+    assert lab.hexcodes == [ c.hexcode for c in expected ]
+    assert np.allclose(lab.clamped_rgb, [ c.clamped_rgb for c in expected ])
+
+
+def test_indexing():
+    arr = spectra.ColorArray("lab", SAMPLES["lab"])
+    assert len(arr) == 4
+    assert arr[1].values == (90, 10, -60)
+    assert len(arr[1:3]) == 2
+    assert arr[np.int64(1)].values == (90, 10, -60)
+    assert arr[[ 0, 2 ]].values.tolist() == arr.values[[ 0, 2 ]].tolist()
+    mask = np.array([ True, False, True, False ])
+    assert arr[mask].values.tolist() == arr.values[mask].tolist()
+    faded = spectra.ColorArray("lab", SAMPLES["lab"], alpha=[ 0.1, 0.2, 0.3, 0.4 ])
+    assert faded[mask].alpha.tolist() == [ 0.1, 0.3 ]
+    assert faded[[ 3 ]][0].alpha == 0.4
+    with pytest.raises(ValueError):
+        spectra.ColorArray("lab", [ (1, 2, 3, 4) ])
+
+
+@pytest.mark.parametrize("method", [ "brighten", "darken", "saturate", "desaturate" ])
+def test_adjustments_match_color(method):
+    colors = [ spectra.html(h) for h in [ "#ff8000", "papayawhip", "#123456" ] ]
+    amounts = [ 5, 10, 20 ]
+    arr = getattr(spectra, method)(colors, amounts)
+    expected = [ getattr(c, method)(a) for c, a in zip(colors, amounts) ]
+    assert arr.space == "rgb"
+    assert np.allclose(arr.values, [ c.values for c in expected ])
+
+    lab = spectra.ColorArray("lab", SAMPLES["lab"])
+    adjusted = getattr(lab, method)(15)
+    expected = [ getattr(c, method)(15) for c in lab ]
+    assert adjusted.space == "lab"
+    assert np.allclose(adjusted.values, [ c.values for c in expected ])
+    with pytest.raises(ValueError):
+        getattr(lab, method)([ 1, 2 ])
+
+
+def test_alpha():
+    colors = [ spectra.lab(50, 0, 0, alpha=0.2), spectra.html("red"),
+        spectra.hsl(200, 0.5, 0.5, alpha=0.5) ]
+    arr = spectra.ColorArray.from_colors(colors)
+    assert arr.alpha.tolist() == [ 0.2, 1.0, 0.5 ]
+    assert [ c.alpha for c in arr ] == [ 0.2, 1.0, 0.5 ]
+    assert arr[2].alpha == 0.5 and arr[1:].alpha.tolist() == [ 1.0, 0.5 ]
+    assert arr.to("rgb").alpha.tolist() == [ 0.2, 1.0, 0.5 ]
+    assert arr.rgba[:, 3].tolist() == [ 0.2, 1.0, 0.5 ]
+    assert spectra.ColorArray.from_colors(colors[1:2]).alpha is None
+    assert spectra.html_many([ "#ff000080", "blue" ]).alpha.tolist() == [ 128 / 255.0, 1.0 ]
+    with pytest.raises(ValueError):
+        spectra.ColorArray("rgb", [ (1, 0, 0) ], alpha=[ 2.0 ])
+    with pytest.raises(ValueError):
+        spectra.ColorArray("rgb", [ (1, 0, 0) ], alpha=[ 0.5, 0.5 ])
+
+    # Batch operations keep alpha, as their Color equivalents do.
+    results = [
+        (spectra.brighten(colors), [ c.brighten() for c in colors ]),
+        (spectra.ops().desaturate(5).to("lab")(colors),
+            [ c.desaturate(5).to("lab") for c in colors ]),
+        (spectra.gamut_map(colors), [ spectra.gamut_map(c) for c in colors ]),
+        (spectra.complementary(colors), [ c.complementary() for c in colors ]),
+        (spectra.monochrome(colors)[0], [ c.monochrome()[0] for c in colors ]),
+    ]
+    for batch, expected in results:
+        assert [ c.alpha for c in batch ] == [ c.alpha for c in expected ]
+
+    color_scale = spectra.scale([ "#ff000000", "#0000ff" ])
+    mapped = color_scale.map([ 0, 0.5, 2 ], output="array", out_of_domain="mask")
+    assert mapped.alpha[:2].tolist() == [ 0.0, 0.5 ] and np.isnan(mapped.alpha[2])
+    chunk = next(color_scale.iter_range(3, chunk=3))
+    assert chunk.alpha.tolist() == [ c.alpha for c in color_scale.range(3) ]
+    assert spectra.scale([ "red", "blue" ]).map([ 0.5 ], output="array").alpha is None
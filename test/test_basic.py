@@ -16,8 +16,209 @@ def test_polylinear():
     assert(results == goal)
 
 
+def test_domain_must_increase():
+    for domain in ([ 0, 0, 1 ], [ 0, 1, 0.5 ], [ 1, 0.5, 0 ]):
+        with pytest.raises(ValueError):
+            spectra.scale([ 'red', 'blue', 'green' ]).domain(domain)
+
+
 def test_polylinear_fail():
     colors = ['yellow', 'red', 'black']
     domain = [ 0, 50 ] # Domain has one too few items
     with pytest.raises(ValueError):
         spectra.scale(colors).domain(domain)
+
+
+def test_lazy_rgb():
+    lab = spectra.lab(50, 80, 10)
+    assert lab.values == (50, 80, 10)
+    converted = lab.to("rgb")
+    assert lab.rgb == converted.values
+    assert lab.clamped_rgb == tuple(min(max(v, 0.0), 1.0) for v in lab.rgb)
+    assert lab.rbg_clamped == lab.clamped_rgb
+    assert lab.hexcode == converted.hexcode
+
+
+def test_compiled_scale():
+    color_scale = spectra.scale(['yellow', 'red', 'black']).domain([0, 50, 100])
+    compiled = color_scale.compile()
+    for x in [ 0, 10, 25, 50, 51, 99.5, 100 ]:
+        assert compiled(x).values == color_scale(x).values
+        assert compiled.hexcode(x) == color_scale(x).hexcode
+    table = color_scale.compile(resolution=101)
+    assert [ table.hexcode(x) for x in [ 0, 25, 50, 75, 100 ] ] == \
+        ['#ffff00', '#ff8000', '#ff0000', '#800000', '#000000']
+    with pytest.raises(ValueError):
+        table.hexcode(101)
+
+
+def test_scale_map():
+    color_scale = spectra.scale(['yellow', 'red', 'black']).domain([0, 50, 100])
+    numbers = [ 0, 25, 50, 75, 100 ]
+    goal = ['#ffff00', '#ff8000', '#ff0000', '#800000', '#000000']
+    assert color_scale.map(numbers) == goal
+    assert color_scale.map(iter(numbers)) == goal
+    rgb = color_scale.map(numbers, output="rgb")
+    assert rgb.shape == (5, 3)
+    assert rgb[1].tolist() == list(color_scale(25).clamped_rgb)
+    assert color_scale.map(numbers, output="array").space == "rgb"
+
+
+def test_scale_map_out_of_domain():
+    color_scale = spectra.scale(['yellow', 'red', 'black']).domain([0, 50, 100])
+    numbers = [ -10, 50, 110, float("nan") ]
+    with pytest.raises(ValueError):
+        color_scale.map(numbers)
+    with pytest.raises(ValueError):
+        color_scale.map(numbers, out_of_domain="clip")
+    assert color_scale.map(numbers, out_of_domain="clip", mask_color="") == \
+        ['#ffff00', '#ff0000', '#000000', '']
+    assert color_scale.map(numbers[:3], out_of_domain="clip") == \
+        ['#ffff00', '#ff0000', '#000000']
+    with pytest.raises(ValueError):
+        color_scale.map(numbers, out_of_domain="mask")
+    assert color_scale.map(numbers, out_of_domain="mask", mask_color="#cccccc") == \
+        ['#cccccc', '#ff0000', '#cccccc', '#cccccc']
+
+
+def test_conversion_cache():
+    assert spectra.cache_info() is None
+    spectra.enable_cache(maxsize=2)
+    try:
+        teal = spectra.html("teal")
+        first = teal.to("lab")
+        assert teal.to("lab").values == first.values
+        assert spectra.html("teal").brighten(5).values == teal.brighten(5).values
+        info = spectra.cache_info()
+        assert info.hits >= 2
+        assert info.evictions >= 1
+        assert info.currsize == 2
+        spectra.cache_clear()
+        assert spectra.cache_info() == (0, 0, 0, 2, 0)
+    finally:
+        spectra.disable_cache()
+    assert spectra.cache_info() is None
+
+
+def test_html_parsing():
+    from spectra.grapefruit import Color as GC
+    for html in [ "#ff8000", "FF8000", " #F60 ", "papayawhip" ]:
+        assert spectra.html(html).values == GC.HtmlToRgb(html)
+    assert spectra.html("#ff800080").values == GC.HtmlToRgb("#ff8000")
+    with pytest.raises(ValueError):
+        spectra.html("#ff80")
+    many = spectra.html_many([ "red", "#00f", "papayawhip" ])
+    assert many.hexcodes == [ "#ff0000", "#0000ff", "#ffefd5" ]
+
+
+def test_to_hex():
+    colors = [ spectra.html("teal"), spectra.lab(50, 80, 10),
+        spectra.hsl(200, 0.5, 0.5), spectra.lab(90, -10, 20) ]
+    assert spectra.to_hex(colors) == [ c.hexcode for c in colors ]
+    assert spectra.to_hex(spectra.html_many([ "red", "#00f" ])) == \
+        [ "#ff0000", "#0000ff" ]
+
+
+def test_color_immutable_and_hashable():
+    a = spectra.lab(50, 80, 10)
+    b = spectra.lab(50, 80, 10)
+    assert a == b and hash(a) == hash(b)
+    assert a != spectra.lab(50, 80, 11)
+    assert a != spectra.Color("lch", 50, 80, 10)
+    assert len({ a: 1, b: 2 }) == 1
+    with pytest.raises(AttributeError):
+        a.values = (1, 2, 3)
+    with pytest.raises(AttributeError):
+        a.extra = True
+
+
+def test_color_validates_values():
+    with pytest.raises(TypeError):
+        spectra.Color("rgb", 1, 2)
+    with pytest.raises(TypeError):
+        spectra.Color("lab", 1, 2)
+    with pytest.raises(TypeError):
+        spectra.Color("cmyk", 0.1, 0.2, 0.3)
+    with pytest.raises(ValueError):
+        spectra.Color("rgb", 1, 2, "blue")
+    with pytest.raises(KeyError):
+        spectra.Color("rgba", 1, 0, 0, 1)
+    assert spectra.Color("rgb", 1, 0, 0).values == (1.0, 0.0, 0.0)
+    cmy = spectra.cmy(0.1, 0.2, 0.3, alpha=0.5)
+    assert (cmy.space, cmy.values, cmy.alpha) == ("cmy", (0.1, 0.2, 0.3), 0.5)
+    assert cmy.rgb == pytest.approx((0.9, 0.8, 0.7))
+
+
+def test_iter_range():
+    color_scale = spectra.scale(['yellow', 'red', 'black']).domain([0, 50, 100])
+    expected = [ c.hexcode for c in color_scale.range(7) ]
+    assert [ c.hexcode for c in color_scale.iter_range(7) ] == expected
+    chunks = list(spectra.iter_range(['yellow', 'red', 'black'], 7, chunk=3))
+    assert [ len(c) for c in chunks ] == [ 3, 3, 1 ]
+    assert sum([ c.hexcodes for c in chunks ], []) == expected
+    with pytest.raises(ValueError):
+        color_scale.iter_range(1)
+
+
+def test_uniform_range():
+    from spectra.difference import delta_e_cie2000
+    color_scale = spectra.scale(['yellow', 'red', 'black']).domain([0, 80, 100])
+    even = color_scale.range(9, uniform=True)
+    assert even[0].hexcode == '#ffff00' and even[-1].hexcode == '#000000'
+    lab = [ c.to("lab").values for c in even ]
+    steps = delta_e_cie2000(lab[:-1], lab[1:])
+    assert steps.max() < 1.2 * steps.min()
+    chunks = list(color_scale.iter_range(9, chunk=4, uniform=True))
+    assert sum([ c.hexcodes for c in chunks ], []) == [ c.hexcode for c in even ]
+
+
+def test_apply_raster():
+    import numpy as np
+    color_scale = spectra.scale(['yellow', 'red', 'black']).domain([0, 50, 100])
+    grid = np.array([ [ 0, 25, 50 ], [ 75, 100, np.nan ] ])
+    with pytest.raises(ValueError):
+        color_scale.apply_raster(grid)
+    out = np.full((2, 3, 4), 7, dtype=np.uint8)
+    result = color_scale.apply_raster(grid, out=out, alpha=True,
+        out_of_domain="mask", chunk_rows=1)
+    assert result is out
+    expected = color_scale.map(grid[0].tolist() + grid[1, :2].tolist())
+    pixels = [ "#%02x%02x%02x" % tuple(p[:3]) for p in out.reshape(-1, 4)[:5] ]
+    assert pixels == expected
+    assert out[:, :, 3].tolist() == [ [ 255, 255, 255 ], [ 255, 255, 0 ] ]
+    assert out[1, 2].tolist() == [ 0, 0, 0, 0 ]
+    floats = color_scale.apply_raster(grid[:1], dtype=float)
+    assert floats.shape == (1, 3, 3)
+    assert floats[0, 1].tolist() == list(color_scale(25).clamped_rgb)
+
+
+def test_alpha():
+    import numpy as np
+    c = spectra.html("#ff800080")
+    assert c.alpha == 128 / 255.0
+    assert c.rgba == (1.0, 128 / 255.0, 0.0, 128 / 255.0)
+    assert spectra.html("#ff8000").alpha == 1.0
+    assert c != spectra.html("#ff8000")
+    assert hash(c) != hash(spectra.html("#ff8000"))
+    with pytest.raises(ValueError):
+        spectra.rgb(1, 0, 0, alpha=1.5)
+
+    faded = spectra.lab(50, 20, 10, alpha=0.25)
+    assert faded.to("rgb").alpha == 0.25
+    assert faded.brighten(5).alpha == 0.25
+    assert faded.saturate(5).alpha == 0.25
+    assert faded.complementary().alpha == 0.25
+    assert spectra.gamut_map(faded).alpha == 0.25
+    assert spectra.ops().brighten(5).to("hsl")(faded).alpha == 0.25
+    assert faded.blend(spectra.lab(50, 20, 10), 0.5).alpha == 0.625
+
+    color_scale = spectra.scale([ "#ff000000", "#0000ff" ]).domain([ 0, 100 ])
+    assert color_scale(25).alpha == 0.25
+    assert color_scale.compile()(25).alpha == 0.25
+    rgba = color_scale.map([ 0, 25, 100, 200 ], output="rgba", out_of_domain="mask")
+    assert rgba.shape == (4, 4)
+    assert np.allclose(rgba[:3, 3], [ 0.0, 0.25, 1.0 ])
+    assert np.allclose(rgba[:3, :3], color_scale.map([ 0, 25, 100 ], output="rgb"))
+    assert np.isnan(rgba[3]).all()
+    raster = color_scale.apply_raster([ [ 0, 50, 100 ] ], alpha=True)
+    assert raster[0, :, 3].tolist() == [ 0, 128, 255 ]
@@ -0,0 +1,53 @@
+import io
+
+import pytest
+
+import spectra
+from spectra import cli
+
+
+def run(argv, text):
+    stdout = io.StringIO()
+    cli.main(argv, stdin=io.StringIO(text), stdout=stdout)
+    return stdout.getvalue().splitlines()
+
+
+def test_scale():
+    color_scale = spectra.scale([ "white", "red" ]).domain([ 0, 100 ]).colorspace("lab")
+    numbers = list(range(0, 101, 5))
+    text = "\n".join(str(n) for n in numbers) + "\n"
+    lines = run([ "--colors", "white,red", "--domain", "0,100", "--space", "lab",
+        "--batch-size", "4" ], text)
+    assert lines == [ color_scale(n).hexcode for n in numbers ]
+
+    lines = run([ "--colors", "white,red", "--output", "values" ], "0.5\n")
+    assert [ float(x) for x in lines[0].split(",") ] == pytest.approx([ 1, 0.5, 0.5 ])
+
+
+def test_scale_out_of_domain():
+    args = [ "--colors", "white,red" ]
+    assert run(args + [ "--out-of-domain", "clip" ], "2\n") == [ "#ff0000" ]
+    assert run(args + [ "--out-of-domain", "clip", "--mask-color", "-" ],
+        "nan\n0\n") == [ "-", "#ffffff" ]
+    assert run(args + [ "--out-of-domain", "mask", "--mask-color", "-" ],
+        "2\n1\n") == [ "-", "#ff0000" ]
+    with pytest.raises(SystemExit):
+        run(args, "2\n")
+
+
+def test_convert():
+    lines = run([ "--from", "lab", "--to", "rgb" ], "50 20 -30\n\n50,20,-30\n")
+    expected = spectra.lab(50, 20, -30).rgb
+    assert len(lines) == 2
+    for line in lines:
+        assert [ float(x) for x in line.split(",") ] == pytest.approx(expected, abs=1e-5)
+    lines = run([ "--from", "html", "--to", "lab" ], "red\n#00f\n")
+    for line, html in zip(lines, [ "red", "#00f" ]):
+        expected = spectra.html(html).to("lab").values
+        assert [ float(x) for x in line.split(",") ] == pytest.approx(expected, abs=1e-3)
+    assert run([ "--from", "html", "--to", "lab", "--output", "hex" ],
+        "red\n#00f\n") == [ "#ff0000", "#0000ff" ]
+    with pytest.raises(SystemExit):
+        run([ "--from", "lab", "--to", "rgb" ], "50 20\n")
+    with pytest.raises(SystemExit):
+        run([], "")
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+import spectra
+from spectra import compositing
+
+
+def random_layers(count=5, shape=(7, 9)):
+    rng = np.random.RandomState(3)
+    return rng.uniform(0, 1, (count,) + shape + (4,))
+
+
+def over(bottom, top):
+    # Straight-alpha "over", one pair of layers at a time.
+    a = top[..., 3:] + bottom[..., 3:] * (1 - top[..., 3:])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rgb = (top[..., :3] * top[..., 3:]
+            + bottom[..., :3] * bottom[..., 3:] * (1 - top[..., 3:])) / a
+    return np.concatenate((np.where(a > 0, rgb, 0.0), a), axis=-1)
+
+
+def test_over_matches_sequential():
+    layers = random_layers()
+    expected = layers[0]
+    for layer in layers[1:]:
+        expected = over(expected, layer)
+    result = spectra.composite(layers)
+    assert result.shape == (7, 9, 4)
+    assert np.allclose(result, expected)
+    assert np.allclose(spectra.composite(list(layers)), expected)
+
+
+def test_premultiplied():
+    layers = random_layers()
+    premultiplied = layers.copy()
+    premultiplied[..., :3] *= layers[..., 3:]
+    for mode in compositing.MODES:
+        straight = spectra.composite(layers, mode)
+        result = spectra.composite(premultiplied, mode, premultiplied=True)
+        assert np.allclose(result[..., 3], straight[..., 3])
+        assert np.allclose(result[..., :3], straight[..., :3] * straight[..., 3:])
+
+
+def test_opaque_and_transparent_layers():
+    layers = random_layers(3)
+    layers[..., 3] = 1.0
+    assert np.allclose(spectra.composite(layers), layers[-1])
+    layers[1:, ..., 3] = 0.0
+    assert np.allclose(spectra.composite(layers), layers[0])
+    layers[..., 3] = 0.0
+    assert np.array_equal(spectra.composite(layers), np.zeros((7, 9, 4)))
+
+
+def test_blend_modes():
+    layers = random_layers(2)
+    layers[..., 3] = 1.0
+    multiplied = spectra.composite(layers, "multiply")
+    assert np.allclose(multiplied[..., :3], layers[0, ..., :3] * layers[1, ..., :3])
+    screened = spectra.composite(layers, "screen")
+    assert np.allclose(1 - screened[..., :3],
+        (1 - layers[0, ..., :3]) * (1 - layers[1, ..., :3]))
+    # Over a transparent backdrop, every mode just shows the source.
+    layers[0, ..., 3] = 0.0
+    layers[1, ..., 3] = 0.5
+    for mode in compositing.MODES:
+        assert np.allclose(spectra.composite(layers, mode), layers[1])
+
+
+def test_colors():
+    red = spectra.html("red")
+    blue = spectra.rgb(0, 0, 1, alpha=0.5)
+    result = spectra.composite([ red, blue ])
+    assert result.space == "rgb"
+    assert result.values == (0.5, 0.0, 0.5) and result.alpha == 1.0
+    assert spectra.composite([ spectra.lab(50, 0, 0, alpha=0.4) ]).alpha == 0.4
+    assert spectra.composite([ spectra.html("#00000000"), blue ]) == blue
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        spectra.composite(random_layers(), mode="overlay")
+    with pytest.raises(ValueError):
+        spectra.composite(np.zeros((2, 3)))
+    with pytest.raises(ValueError):
+        spectra.composite(np.zeros((0, 4)))
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+from colormath2 import color_diff, color_objects
+
+import spectra
+
+LABS = [ (50, -20, 30), (90, 10, -60), (0, 0, 0), (30, 80, 10), (52, -18, 33) ]
+
+
+@pytest.mark.parametrize("method", [ "cie1976", "cie1994", "cie2000" ])
+def test_matches_colormath(method):
+    func = getattr(color_diff, "delta_e_" + method)
+    colors = [ spectra.lab(*v) for v in LABS ]
+    matrix = spectra.delta_e_matrix(colors, method=method, chunk_size=2)
+    for i, a in enumerate(LABS):
+        for j, b in enumerate(LABS):
+            expected = func(color_objects.LabColor(*a), color_objects.LabColor(*b))
+            assert matrix[i, j] == pytest.approx(expected, abs=1e-9)
+    assert spectra.delta_e(colors[0], colors[3], method=method) == \
+        pytest.approx(matrix[0, 3])
+
+
+def test_broadcasting():
+    colors = spectra.ColorArray("lab", LABS)
+    distances = spectra.delta_e(spectra.lab(*LABS[0]), colors)
+    assert distances.shape == (5,)
+    assert distances[0] == 0
+    assert np.allclose(spectra.delta_e(colors, colors), 0)
+    with pytest.raises(ValueError):
+        spectra.delta_e(colors, colors, method="nonesuch")
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+import spectra
+from spectra import dithering
+from spectra.grapefruit import Color as GC
+
+
+def gradient_image(height=17, width=23):
+    y, x = np.mgrid[0:height, 0:width]
+    return np.dstack((x / (width - 1.0), y / (height - 1.0),
+        np.full((height, width), 0.45)))
+
+
+def floyd_steinberg(image, palette):
+    # A straightforward, pixel-at-a-time reference implementation.
+    work = image.astype(float).copy()
+    height, width = work.shape[:2]
+    out = np.empty((height, width), dtype=int)
+    for y in range(height):
+        for x in range(width):
+            value = work[y, x].copy()
+            i = int(np.argmin(np.sum((palette - value) ** 2, axis=1)))
+            out[y, x] = i
+            error = value - palette[i]
+            if x + 1 < width: work[y, x + 1] += error * 7 / 16.0
+            if y + 1 < height:
+                if x > 0: work[y + 1, x - 1] += error * 3 / 16.0
+                work[y + 1, x] += error * 5 / 16.0
+                if x + 1 < width: work[y + 1, x + 1] += error * 1 / 16.0
+    return out
+
+
+def test_websafe_matches_grapefruit():
+    values = np.random.RandomState(0).uniform(0, 1, (200, 3))
+    values[:5] = [ (1, 0.55, 0), (0.2, 0.4, 0.6), (0.1, 0.3, 0.5), (0, 0, 0), (1, 1, 1) ]
+    for alt in (False, True):
+        expected = [ GC.RgbToWebSafe(*v, alt=alt) for v in values.tolist() ]
+        assert np.allclose(dithering.websafe(values, alt=alt), expected)
+
+
+def test_bayer_matrix():
+    assert dithering.bayer_matrix(2).tolist() == [ [ 0, 2 ], [ 3, 1 ] ]
+    assert sorted(dithering.bayer_matrix(8).ravel().tolist()) == list(range(64))
+    with pytest.raises(ValueError):
+        dithering.bayer_matrix(6)
+
+
+@pytest.mark.parametrize("palette", [ "websafe", [ "black", "white", "red", "#123456", "teal" ] ])
+def test_floyd_steinberg_matches_reference(palette):
+    image = gradient_image()
+    indices = spectra.dither(image, palette, output="index")
+    colors = dithering._Palette(palette).colors
+    assert np.array_equal(indices, floyd_steinberg(image, colors))
+
+
+def test_methods_and_outputs():
+    image = np.floor(0.5 + gradient_image() * 255).astype(np.uint8)
+    for method in dithering.METHODS:
+        result = spectra.dither(image, method=method)
+        assert result.shape == image.shape and result.dtype == np.uint8
+        assert set(np.unique(result).tolist()) <= set([ 0, 51, 102, 153, 204, 255 ])
+        if method == "nearest": continue
+        # Dithering roughly preserves the image's average color.
+        assert np.abs(result.mean(axis=(0, 1)) - image.mean(axis=(0, 1))).max() < 10
+
+    nearest = spectra.dither(image / 255.0, method="nearest")
+    assert np.allclose(nearest, dithering.websafe(image / 255.0))
+
+    palette = spectra.ColorArray("rgb", [ (0, 0, 0), (1, 1, 1) ])
+    ordered = spectra.dither(np.full((8, 8, 3), 0.5), palette, method="ordered",
+        output="index")
+    assert ordered.mean() == 0.5
+
+    with pytest.raises(ValueError):
+        spectra.dither(image, method="not-a-method")
+    with pytest.raises(ValueError):
+        spectra.dither(image[0], method="nearest")
@@ -0,0 +1,68 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import spectra
+from spectra import engine
+from test_array import SAMPLES
+
+
+@pytest.mark.parametrize("source", sorted(SAMPLES))
+@pytest.mark.parametrize("target", sorted(SAMPLES))
+def test_python_engine_matches_colormath(source, target):
+    python, colormath = engine.ENGINES["python"], engine.ENGINES["colormath"]
+    for values in SAMPLES[source]:
+        expected = colormath.convert(source, values, target)
+        assert python.convert(source, values, target) == pytest.approx(expected, abs=1e-9)
+
+
+def test_set_engine():
+    assert spectra.get_engine() == "python"
+    teal = spectra.html("teal")
+    expected = teal.to("lab").values
+    spectra.set_engine("colormath")
+    try:
+        assert spectra.get_engine() == "colormath"
+        assert teal.to("lab").values == pytest.approx(expected)
+    finally:
+        spectra.set_engine("python")
+    with pytest.raises(ValueError):
+        spectra.set_engine("nonesuch")
+
+
+def test_cache_is_per_engine():
+    spectra.enable_cache()
+    try:
+        teal = spectra.html("teal")
+        teal.to("lab")
+        spectra.set_engine("colormath")
+        try:
+            teal.to("lab")
+        finally:
+            spectra.set_engine("python")
+        teal.to("lab")
+        info = spectra.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+    finally:
+        spectra.disable_cache()
+
+
+def test_import_is_lazy():
+    code = ("import sys, spectra; "
+        "print(sorted(m for m in ('numpy', 'colormath2', 'spectra.grapefruit') "
+        "if m in sys.modules))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output([ sys.executable, "-c", code ], cwd=root)
+    assert output.decode().strip() == "[]"
+    # Submodules are still reachable as attributes, and load on first use.
+    code = ("import spectra; "
+        "print([ m.__name__ for m in (spectra.grapefruit, spectra.array, "
+        "spectra.difference, spectra.names, spectra.files, spectra.conversions) ])")
+    output = subprocess.check_output([ sys.executable, "-c", code ], cwd=root)
+    assert output.decode().count("spectra.") == 6
+    assert spectra.ColorArray is spectra.array.ColorArray
+    assert "delta_e" in dir(spectra)
+    with pytest.raises(AttributeError):
+        spectra.not_an_attribute
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+import spectra
+
+
+def test_convert_file(tmpdir):
+    rng = np.random.RandomState(0)
+    lab = np.column_stack([ rng.uniform(0, 100, 1000),
+        rng.uniform(-80, 80, 1000), rng.uniform(-80, 80, 1000) ])
+    src = str(tmpdir.join("lab.npy"))
+    dst = str(tmpdir.join("rgb.npy"))
+    np.save(src, lab)
+    calls = []
+    out = spectra.convert_file(src, dst, "lab", "rgb", chunk_rows=300,
+        progress=lambda done, total: calls.append((done, total)))
+    assert isinstance(out, np.memmap)
+    assert calls == [ (300, 1000), (600, 1000), (900, 1000), (1000, 1000) ]
+    expected = spectra.ColorArray("lab", lab).to("rgb").values
+    assert np.array_equal(np.load(dst), expected)
+
+    out = np.zeros((1000, 3))
+    spectra.convert_file(np.load(src, mmap_mode="r"), out, "lab", "rgb")
+    assert np.array_equal(out, expected)
+    with pytest.raises(ValueError):
+        spectra.convert_file(src, np.zeros((10, 3)), "lab", "rgb")
+    with pytest.raises(ValueError):
+        spectra.convert_file(src, dst, "cmyk", "rgb")
+
+
+def test_map_file(tmpdir):
+    color_scale = spectra.scale([ "yellow", "red", "black" ]).colorspace("lab")
+    numbers = np.linspace(0, 1, 1001)
+    src = str(tmpdir.join("numbers.npy"))
+    dst = str(tmpdir.join("rgb.npy"))
+    np.save(src, numbers)
+    spectra.map_file(color_scale, src, dst, chunk_rows=300)
+    assert np.array_equal(np.load(dst), color_scale.map(numbers, output="rgb"))
+
+    np.save(src, numbers * 2)
+    with pytest.raises(ValueError):
+        spectra.map_file(color_scale, src, dst, chunk_rows=300)
+    spectra.map_file(color_scale, src, dst, out_of_domain="clip")
+    assert np.array_equal(np.load(dst),
+        color_scale.map(numbers * 2, output="rgb", out_of_domain="clip"))
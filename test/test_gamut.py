@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+import spectra
+from spectra import gamut
+
+
+def random_lch(n=500):
+    rng = np.random.RandomState(1)
+    return np.column_stack([ rng.uniform(0, 100, n),
+        rng.uniform(0, 150, n), rng.uniform(0, 360, n) ])
+
+
+def test_in_gamut():
+    assert spectra.in_gamut(spectra.html("red"))
+    assert spectra.in_gamut(spectra.lab(100, 0, 0))
+    assert not spectra.in_gamut(spectra.lab(101, 0, 0))
+    assert not spectra.in_gamut(spectra.lch(50, 150, 200))
+    rgb = spectra.ColorArray("rgb", [ (1.2, 0.5, -0.1), (0.5, 0.5, 0.5) ])
+    assert spectra.in_gamut(rgb).tolist() == [ False, True ]
+
+
+@pytest.mark.parametrize("method", gamut.METHODS)
+def test_gamut_map(method):
+    lch = spectra.ColorArray("lch", random_lch())
+    inside = spectra.in_gamut(lch)
+    assert 0 < inside.sum() < len(lch)
+    mapped = spectra.gamut_map(lch, method)
+    assert mapped.space == "lch"
+    assert spectra.in_gamut(mapped).all()
+    assert np.array_equal(mapped.values[inside], lch.values[inside])
+
+    lab = spectra.gamut_map(lch.to("lab"), method)
+    assert lab.space == "lab"
+    assert spectra.in_gamut(lab).all()
+
+
+def test_chroma_keeps_hue():
+    lch = spectra.ColorArray("lch", random_lch())
+    mapped = spectra.gamut_map(lch, "chroma").values
+    assert np.allclose(mapped[:, 2], lch.values[:, 2])
+    assert np.all(mapped[:, 1] <= lch.values[:, 1] + 1e-9)
+    # The chroma found is (nearly) the largest in gamut.
+    bumped = mapped + [ 0, 0.01, 0 ]
+    outside = ~spectra.in_gamut(lch)
+    bumped = spectra.ColorArray("lch", bumped[outside & (mapped[:, 0] > 1)
+        & (mapped[:, 0] < 99)])
+    assert not spectra.in_gamut(bumped).any()
+
+
+def test_minde_keeps_more_chroma():
+    lch = spectra.ColorArray("lch", random_lch())
+    outside = ~spectra.in_gamut(lch)
+    chroma = spectra.gamut_map(lch, "chroma").values[outside, 1]
+    minde = spectra.gamut_map(lch, "minde").values[outside, 1]
+    assert minde.mean() > chroma.mean()
+
+
+def test_single_colors():
+    color = spectra.html("red").saturate(40)
+    assert not spectra.in_gamut(color)
+    mapped = spectra.gamut_map(color, "minde")
+    assert isinstance(mapped, spectra.Color)
+    assert mapped.space == "rgb"
+    assert spectra.in_gamut(mapped)
+    assert spectra.gamut_map(color, "clip").values == pytest.approx((1, 0, 0), abs=1e-9)
+    with pytest.raises(ValueError):
+        spectra.gamut_map(color, "not-a-method")
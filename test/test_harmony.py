@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import spectra
+from spectra import harmony
+from spectra.grapefruit import Color as GC
+
+HEXCODES = [ "#ff8000", "papayawhip", "#123456", "teal", "#808080", "#e0e0ff", "#0a0a0a" ]
+
+
+def test_wheels_match_grapefruit():
+    hues = np.linspace(0, 359.9, 1000)
+    assert np.allclose(harmony.rgb_to_ryb(hues), [ GC.RgbToRyb(h) for h in hues ])
+    assert np.allclose(harmony.ryb_to_rgb(hues), [ GC.RybToRgb(h) for h in hues ])
+
+
+@pytest.mark.parametrize("mode", harmony.MODES)
+def test_schemes_match_grapefruit(mode):
+    colors = [ spectra.html(h) for h in HEXCODES ]
+    base = [ GC.NewFromHtml(h) for h in HEXCODES ]
+    cases = [
+        (spectra.complementary(colors, mode=mode),
+            [ [ c.ComplementaryColor(mode=mode) ] for c in base ]),
+        (spectra.triadic(colors, angle=40, mode=mode),
+            [ c.TriadicScheme(angle=40, mode=mode) for c in base ]),
+        (spectra.tetradic(colors, mode=mode),
+            [ c.TetradicScheme(mode=mode) for c in base ]),
+        (spectra.analogous(colors, angle=20, mode=mode),
+            [ c.AnalogousScheme(angle=20, mode=mode) for c in base ]),
+        (spectra.monochrome(colors),
+            [ c.MonochromeScheme() for c in base ]),
+    ]
+    for result, expected in cases:
+        if isinstance(result, spectra.ColorArray):
+            result = (result,)
+        assert len(result) == len(expected[0])
+        for i, arr in enumerate(result):
+            assert arr.space == "rgb"
+            assert np.allclose(arr.values, [ e[i].rgb for e in expected ])
+
+
+def test_color_methods():
+    color = spectra.html("#ff8000")
+    complement = color.complementary()
+    assert isinstance(complement, spectra.Color)
+    assert complement.hexcode == GC.NewFromHtml("#ff8000").ComplementaryColor().html
+    lab = color.to("lab")
+    for scheme, size in [ ("triadic", 2), ("tetradic", 3), ("analogous", 2), ("monochrome", 4) ]:
+        result = getattr(lab, scheme)()
+        assert len(result) == size
+        assert all(c.space == "lab" for c in result)
+    with pytest.raises(ValueError):
+        color.triadic(mode="cmyk")
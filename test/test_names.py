@@ -0,0 +1,21 @@
+import numpy as np
+
+import spectra
+from spectra.grapefruit import Color as GC
+from spectra.names import _get_index
+
+
+def test_exact_names():
+    assert spectra.html("papayawhip").nearest_name() == "papayawhip"
+    assert spectra.html("#00ffff").nearest_name() == "aqua"
+    assert spectra.html("#fe0001").nearest_name() == "red"
+
+
+def test_matches_brute_force():
+    rng = np.random.RandomState(0)
+    colors = spectra.ColorArray("rgb", rng.uniform(size=(500, 3)))
+    index = _get_index()
+    named = spectra.html_many([ GC.NAMED_COLOR[n] for n in index.names ])
+    distances = spectra.delta_e_matrix(colors, named, method="cie1976")
+    expected = [ index.names[i] for i in distances.argmin(axis=1) ]
+    assert spectra.nearest_names(colors) == expected
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+import spectra
+from spectra import parallel
+
+
+def test_convert_matches_serial():
+    rng = np.random.RandomState(0)
+    lab = np.column_stack([ rng.uniform(0, 100, 1000),
+        rng.uniform(-80, 80, 1000), rng.uniform(-80, 80, 1000) ])
+    result = parallel.convert(lab, "lab", "rgb", workers=2, chunk_size=300)
+    assert np.array_equal(result, spectra.ColorArray("lab", lab).to("rgb").values)
+
+
+def test_map_scale_matches_serial():
+    color_scale = spectra.scale([ "yellow", "red", "black" ]).colorspace("lab")
+    numbers = np.linspace(0, 1, 1001)
+    result = parallel.map_scale(color_scale, numbers, workers=2, chunk_size=300)
+    assert np.array_equal(result, color_scale.map(numbers, output="rgb"))
+    with pytest.raises(ValueError):
+        parallel.map_scale(color_scale, numbers + 1, workers=2, chunk_size=300)
+
+
+def test_reachable_from_package():
+    import os, subprocess, sys
+    code = "import spectra; print(spectra.parallel.convert.__module__)"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output([ sys.executable, "-c", code ], cwd=root)
+    assert output.decode().strip() == "spectra.parallel"
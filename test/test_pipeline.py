@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+import spectra
+from test_array import SAMPLES
+
+
+def test_plan():
+    pipeline = spectra.ops().brighten(5).saturate(10).darken(2).to("lab").to("hsl")
+    assert pipeline.plan("lab") == [
+        ("convert", "lab", "lch"),
+        ("adjust", (3.0, 10.0)),
+        ("convert", "lch", "hsl"),
+    ]
+    # Colors derived from RGB return to RGB between adjustments.
+    assert pipeline.plan("hsl")[:4] == [
+        ("convert", "hsl", "lch"),
+        ("adjust", (5.0, 0.0)),
+        ("convert", "lch", "rgb"),
+        ("convert", "rgb", "lch"),
+    ]
+    assert spectra.ops().plan("rgb") == []
+    with pytest.raises(ValueError):
+        spectra.ops().to("not-a-space")
+
+
+def test_matches_color_methods():
+    pipeline = spectra.ops().brighten(5).saturate(10).to("hsl").desaturate(3)
+    for hexcode in [ "#ff8000", "papayawhip", "#123456", "teal" ]:
+        color = spectra.html(hexcode)
+        expected = color.brighten(5).saturate(10).to("hsl").desaturate(3)
+        result = pipeline(color)
+        assert isinstance(result, spectra.Color)
+        assert result.space == "hsl"
+        assert result.values == pytest.approx(expected.values)
+        assert result.hexcode == expected.hexcode
+        lab = color.to("lab")
+        assert pipeline(lab).values == pytest.approx(
+            lab.brighten(5).saturate(10).to("hsl").desaturate(3).values)
+
+
+def test_batches():
+    pipeline = spectra.ops().darken([ 1, 2, 3, 4 ]).to("rgb")
+    lab = spectra.ColorArray("lab", SAMPLES["lab"])
+    result = pipeline.apply(lab)
+    expected = [ c.darken(a).to("rgb").values for c, a in zip(lab, [ 1, 2, 3, 4 ]) ]
+    assert result.space == "rgb"
+    assert np.allclose(result.values, expected)
+
+    colors = [ spectra.html("red"), spectra.html("blue") ]
+    result = spectra.ops().brighten(10)(colors)
+    assert result.hexcodes == [ c.brighten(10).hexcode for c in colors ]
+    with pytest.raises(ValueError):
+        pipeline(lab[0])
+
+
+def test_chroma_crossing_zero():
+    chains = [
+        lambda x: x.desaturate(20).saturate(20),
+        lambda x: x.desaturate(20).to("lch").saturate(5),
+        lambda x: x.desaturate(20).to("lab").to("lch").saturate(20),
+        lambda x: x.saturate(-15).brighten(5).to("lch"),
+    ]
+    for start in [ spectra.lab(50, 5, 5), spectra.lch(50, 5, 45), spectra.xyz(0.2, 0.2, 0.1) ]:
+        for chain in chains:
+            expected = chain(start)
+            assert chain(spectra.ops())(start).values == pytest.approx(expected.values)
+            batch = chain(spectra.ops())(spectra.ColorArray(start.space, [ start.values ]))
+            assert batch.values[0] == pytest.approx(expected.values)
+    assert spectra.ops().desaturate(20).saturate(20).plan("lab") == [
+        ("convert", "lab", "lch"),
+        ("adjust", (0.0, -20.0)),
+        ("normalize", "lab"),
+        ("adjust", (0.0, 20.0)),
+        ("convert", "lch", "lab"),
+    ]
+
+
+def test_round_trips_that_change_values():
+    # CMYK -> RGB -> CMYK recomputes K.
+    cmyk = spectra.cmyk(0.5, 0.5, 0.5, 0)
+    for middle in [ "rgb", "hsl", "hsv" ]:
+        expected = cmyk.to(middle).to("cmyk")
+        result = spectra.ops().to(middle).to("cmyk")(cmyk)
+        assert result.values == pytest.approx(expected.values)
+    assert spectra.ops().to("rgb").to("cmyk")(cmyk).values == pytest.approx((0, 0, 0, 0.5))
+    # LCH -> LAB -> LCH resets the hue of achromatic colors.
+    gray = spectra.lch(50, 0, 120)
+    for middle in [ "lab", "xyz" ]:
+        expected = gray.to(middle).saturate(20)
+        result = spectra.ops().to(middle).saturate(20)(gray)
+        assert result.values == pytest.approx(expected.values)
+        batch = spectra.ops().to(middle).saturate(20)(spectra.ColorArray.from_colors([ gray ]))
+        assert batch.values[0] == pytest.approx(
+            spectra.ColorArray.from_colors([ gray ]).to(middle).saturate(20).values[0])
+
+
+def test_xyz_from_rgb():
+    pipeline = spectra.ops().to("xyz").darken(10).to("hsl")
+    for hexcode in [ "#ff8000", "teal" ]:
+        color = spectra.html(hexcode)
+        expected = color.to("xyz").darken(10).to("hsl")
+        assert pipeline(color).values == pytest.approx(expected.values)